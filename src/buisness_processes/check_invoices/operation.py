@@ -69,6 +69,9 @@ class InvoiceSearchOperation:
         "ural": ("DMS_USERNAME_URAL", "DMS_PASSWORD_URAL"),
     }
 
+    # Сколько раз start() пробует дождаться таблицы накладных (каждая попытка — новый браузер)
+    MAX_START_ATTEMPTS = 3
+
     def __init__(self, region: str, logger: Logger, config: Config):
         """
         Создаёт операцию для указанного региона.
@@ -233,7 +236,7 @@ class InvoiceSearchOperation:
             self.logger.error(f"Ошибка {e}")
             return CheckedInvoice(invoice=invoice, status=CheckStatus.ERROR)
 
-    def start(self):
+    def start(self, attempt: int = 1):
         """
         Инициализирует сессию:
         1. Запускает браузер
@@ -267,6 +270,13 @@ class InvoiceSearchOperation:
         - Перед каждым шагом — записать в logger.log()
         - При ошибке — logger.error(), затем _safe_quit()
 
+        Примечание:
+        - Если таблица накладных не загрузилась, браузер закрывается и запуск повторяется,
+          но не больше MAX_START_ATTEMPTS раз.
+
+        Args:
+            attempt (int): Номер попытки (1 — первый запуск)
+
         Raises:
             RuntimeError: Если инициализация не удалась
         """
@@ -323,8 +333,11 @@ class InvoiceSearchOperation:
             raise TimeoutError("Загрузка таблицы с накладными долгая")
 
         except TimeoutError as e:
+            self._safe_quit()
+            if attempt >= self.MAX_START_ATTEMPTS:
+                raise RuntimeError(f"Ошибка при запуске DMS ({e}, попыток: {attempt})")
             self.logger.error("Загрузка таблицы с накладными долгая, повторная попытка")
-            self.start()
+            self.start(attempt + 1)
         except Exception as e:
             self._safe_quit()
             raise RuntimeError(f"Ошибка при запуске DMS ({e})")
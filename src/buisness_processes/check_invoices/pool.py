@@ -0,0 +1,92 @@
+"""
+Модуль: pool.py
+Описание: Параллельная проверка накладных в нескольких сессиях браузера.
+
+Назначение:
+- Разделить накладные региона на K частей (шардов).
+- Для каждого шарда открыть свою сессию DMS (InvoiceSearchOperation).
+- Проверять шарды одновременно в ThreadPoolExecutor.
+
+Архитектурная роль:
+- Обёртка над InvoiceSearchOperation для InvoiceCheckerProcess.
+- Каждая сессия WebDriver используется только своим потоком.
+
+Зависимости:
+- InvoiceSearchOperation (операция поиска)
+- Logger, Config
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from src.core.logger import Logger
+from src.core.config import Config
+from src.models.invoice.invoice import Invoice, CheckedInvoice
+from .operation import InvoiceSearchOperation
+
+
+class InvoiceCheckerPool:
+    """
+    Пул сессий DMS для одного региона.
+
+    Атрибуты:
+    - region (str): "siberia" или "ural"
+    - num_drivers (int): Максимальное число одновременных сессий браузера
+    - logger (Logger): Для логирования хода выполнения
+    - config (Config): Конфигурация приложения (логины/пароли)
+    """
+
+    def __init__(self, region: str, logger: Logger, config: Config, num_drivers: int = 4):
+        self.region = region
+        self.logger = logger
+        self.config = config
+        self.num_drivers = max(1, int(num_drivers))
+
+    def check_invoices(self, invoices: List[Invoice]) -> List[CheckedInvoice]:
+        """
+        Проверяет накладные и возвращает результаты в исходном порядке.
+
+        Шаги:
+        1. Разбить накладные на шарды: invoices[i::k]
+        2. Запустить по одной сессии на шард (ThreadPoolExecutor)
+        3. Собрать результаты обратно в порядке исходного списка
+
+        Примечание:
+        - Сессий не больше, чем накладных; для пустого списка браузер не запускается.
+        - При k == 1 всё выполняется в текущем потоке, без пула.
+
+        Args:
+            invoices (List[Invoice]): Накладные одного региона
+
+        Returns:
+            List[CheckedInvoice]: Результаты проверки
+        """
+        if not invoices:
+            return []
+
+        k = min(self.num_drivers, len(invoices))
+        if k == 1:
+            return self._check_shard(invoices)
+
+        shards = [invoices[i::k] for i in range(k)]
+        self.logger.info(f"🧵 {self.region.upper()}: {k} параллельных сессий")
+
+        with ThreadPoolExecutor(max_workers=k, thread_name_prefix=f"dms-{self.region}") as executor:
+            shard_results = list(executor.map(self._check_shard, shards))
+
+        # Шард i содержит позиции i, i+k, i+2k, ... — раскладываем обратно
+        results: List[CheckedInvoice] = [None] * len(invoices)
+        for i, shard_result in enumerate(shard_results):
+            results[i::k] = shard_result
+        return results
+
+    def _check_shard(self, invoices: List[Invoice]) -> List[CheckedInvoice]:
+        """
+        Проверяет шард накладных в собственной сессии браузера.
+        """
+        operator = InvoiceSearchOperation(self.region, self.logger, self.config)
+        operator.start()
+        try:
+            return [operator.check_invoice(invoice) for invoice in invoices]
+        finally:
+            operator.close()
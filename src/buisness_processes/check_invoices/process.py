@@ -17,11 +17,11 @@
 
 Архитектурная роль:
 - Оркестратор: управляет жизненным циклом проверки.
-- Координирует: FileHandler → InvoiceSearchOperation → Reporter.
+- Координирует: FileHandler → InvoiceCheckerPool (InvoiceSearchOperation) → Reporter.
 - Не знает, как читать/писать Excel — только что и когда.
 
 Зависимости:
-- InvoiceSearchOperation (операция поиска)
+- InvoiceCheckerPool / InvoiceSearchOperation (операция поиска)
 - Logger (логирование)
 - FileHandler (работа с Excel)
 - ReporterOfCheckInvoiceProcess (генерация отчёта)
@@ -34,7 +34,7 @@ from typing import List
 # --- Импорты из src ---
 from src.core.logger import Logger
 from src.core.config import Config
-from .operation import InvoiceSearchOperation
+from .pool import InvoiceCheckerPool
 from .report import ReporterOfCheckInvoiceProcess
 
 # --- Импорты из сервисов ---
@@ -45,6 +45,10 @@ from src.models.invoice.invoice_factory import InvoiceFactory
 from src.models.invoice.invoice_validation import FilterInvoices
 
 
+# Верхняя граница параллельных сессий DMS (см. _dms_sessions)
+MAX_DMS_SESSIONS = 4
+
+
 class InvoiceCheckerProcess:
     """
     Процесс проверки накладных из Excel-файла.
@@ -134,7 +138,7 @@ class InvoiceCheckerProcess:
         raw_data = []
         for sheet_name in ["мой куб GC", "мой куб BF", "мой куб PU"]:
             try:
-                data = self.file_handler.read_invoices(sheet_name)
+                data = list(self.file_handler.iter_invoices(sheet_name))
                 self.logger.info(f"✅ Прочитано {len(data)} накладных с листа '{sheet_name}'")
                 raw_data.extend(data)
             except Exception as e:
@@ -210,17 +214,42 @@ class InvoiceCheckerProcess:
 
         self.logger.info(f"🔍 Начинаем проверку региона: {region.upper()} ({len(filtered_invoices)} накладных)")
 
-        operator = InvoiceSearchOperation(region, self.logger, self.config)
-        operator.start()
-        try:
-            for invoice in filtered_invoices:
-                checked_invoice = operator.check_invoice(invoice)
-                data_for_report.append(checked_invoice)
-        finally:
-            operator.close()
+        pool = InvoiceCheckerPool(region, self.logger, self.config,
+                                  num_drivers=self._dms_sessions())
+        data_for_report.extend(pool.check_invoices(filtered_invoices))
 
         self.logger.info(f"✅ Регион {region.upper()} проверен")
 
+    def _dms_sessions(self) -> int:
+        """
+        Возвращает число параллельных сессий DMS из настройки "dms_sessions".
+
+        Примечание:
+        - По умолчанию (ключа нет в settings.json) — одна сессия.
+        - Значение ограничивается диапазоном 1..MAX_DMS_SESSIONS.
+        - Несколько сессий — это одновременные входы под одной учётной записью;
+          что портал DMS их допускает, не проверено — поэтому выводим предупреждение.
+
+        Returns:
+            int: Число сессий браузера на регион
+        """
+        value = self.config.get("dms_sessions", 1)
+        try:
+            sessions = int(value)
+        except (TypeError, ValueError):
+            self.logger.warning(f"⚠️ Некорректное значение dms_sessions={value!r}, используется 1")
+            return 1
+
+        clamped = min(max(sessions, 1), MAX_DMS_SESSIONS)
+        if clamped != sessions:
+            self.logger.warning(f"⚠️ dms_sessions={sessions} вне диапазона 1..{MAX_DMS_SESSIONS}, используется {clamped}")
+        if clamped > 1:
+            self.logger.warning(
+                f"⚠️ dms_sessions={clamped}: одновременные входы в DMS под одной учётной записью "
+                f"не проверены — при ошибках авторизации верните 1"
+            )
+        return clamped
+
     def _generate_report(self, source_path: str, data_for_report: List, is_update: bool):
         """
         Генерирует или обновляет отчёт.
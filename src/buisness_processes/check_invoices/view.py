@@ -17,13 +17,66 @@ from PyQt5.QtWidgets import (
     QFileDialog,
     QFrame, QMessageBox,
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, pyqtSlot
 from PyQt5.QtGui import QFont
 
 # --- Локальные импорты ---
 from src.core.logger import Logger
 from src.core.config import Config
 from src.buisness_processes.check_invoices.process import InvoiceCheckerProcess
+from src.ui.styles import NAV_BUTTON_QSS
+
+
+# === Стили (QSS) кнопок вкладки; общие стили — в src/ui/styles.py ===
+_BROWSE_BTN_QSS = """
+QPushButton {
+    background-color: #1a73e8;
+    color: white;
+    padding: 10px 16px;
+    border-radius: 6px;
+    font-weight: bold;
+}
+QPushButton:hover {
+    background-color: #1765cc;
+}
+"""
+
+_RUN_BTN_QSS = """
+QPushButton {
+    background-color: #34a853;
+    color: white;
+    padding: 16px 24px;
+    border-radius: 8px;
+    font-weight: bold;
+    font-size: 16px;
+    min-height: 60px;
+    margin-top: 15px;
+}
+QPushButton:hover {
+    background-color: #2e9147;
+}
+QPushButton:disabled {
+    background-color: #dadce0;
+    color: #9aa0a6;
+}
+"""
+
+_UPDATE_BTN_QSS = """
+QPushButton {
+    background-color: #ff9800;
+    color: white;
+    padding: 10px 16px;
+    border-radius: 6px;
+    font-weight: bold;
+}
+QPushButton:hover {
+    background-color: #e68900;
+}
+QPushButton:disabled {
+    background-color: #ccc;
+    color: #666;
+}
+"""
 
 
 class CheckInvoicesView(QWidget):
@@ -62,33 +115,7 @@ class CheckInvoicesView(QWidget):
         button = QPushButton("📦 Проверка накладных")
         button.setCheckable(True)
         button.setToolTip("Запустить процесс проверки накладных из Excel")
-        button.setStyleSheet("""
-            QPushButton {
-                text-align: left;
-                padding: 12px 15px;
-                font-size: 14px;
-                font-weight: 500;
-                border: none;
-                background-color: #f0f0f0;
-                color: #202124;
-                border-radius: 8px;
-                margin: 4px 8px;
-            }
-            QPushButton:hover {
-                background-color: #e0e0e0;
-            }
-            QPushButton:checked {
-                background-color: #4285f4;
-                color: white;
-                font-weight: 600;
-            }
-            QPushButton:checked:hover {
-                background-color: #3367d6;
-            }
-            QPushButton:pressed {
-                background-color: #3367d6;
-            }
-        """)
+        button.setStyleSheet(NAV_BUTTON_QSS)
         button.setCursor(Qt.PointingHandCursor)
         return button
 
@@ -124,18 +151,7 @@ class CheckInvoicesView(QWidget):
         browse_btn = QPushButton("📂 Выбрать файл")
         browse_btn.setObjectName("browse_file_button")
         browse_btn.setCursor(Qt.PointingHandCursor)
-        browse_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #1a73e8;
-                color: white;
-                padding: 10px 16px;
-                border-radius: 6px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #1765cc;
-            }
-        """)
+        browse_btn.setStyleSheet(_BROWSE_BTN_QSS)
 
         file_layout.addWidget(self.file_label)
         file_layout.addStretch()
@@ -146,45 +162,12 @@ class CheckInvoicesView(QWidget):
         self.run_button = QPushButton("▶️ Запустить проверку")
         self.run_button.setObjectName("run_process_button")
         self.run_button.setCursor(Qt.PointingHandCursor)
-        self.run_button.setStyleSheet("""
-            QPushButton {
-                background-color: #34a853;
-                color: white;
-                padding: 16px 24px;
-                border-radius: 8px;
-                font-weight: bold;
-                font-size: 16px;
-                min-height: 60px;
-                margin-top: 15px;
-            }
-            QPushButton:hover {
-                background-color: #2e9147;
-            }
-            QPushButton:disabled {
-                background-color: #dadce0;
-                color: #9aa0a6;
-            }
-        """)
+        self.run_button.setStyleSheet(_RUN_BTN_QSS)
         layout.addWidget(self.run_button)
         # === Кнопка "Обновить отчёт" ===
         self.update_button = QPushButton("🔄 Обновить отчёт")
         self.update_button.setCursor(Qt.PointingHandCursor)
-        self.update_button.setStyleSheet("""
-            QPushButton {
-                background-color: #ff9800;
-                color: white;
-                padding: 10px 16px;
-                border-radius: 6px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #e68900;
-            }
-            QPushButton:disabled {
-                background-color: #ccc;
-                color: #666;
-            }
-        """)
+        self.update_button.setStyleSheet(_UPDATE_BTN_QSS)
         self.update_button.setEnabled(False)
         layout.addWidget(self.update_button)
         # === Растяжка вниз ===
@@ -203,6 +186,7 @@ class CheckInvoicesView(QWidget):
         self.run_button.clicked.connect(self._on_run_process)
         self.update_button.clicked.connect(self._on_update_report)
 
+    @pyqtSlot()
     def _on_browse_file(self):
         """Обработчик выбора файла."""
         file_path, _ = QFileDialog.getOpenFileName(
@@ -231,6 +215,7 @@ class CheckInvoicesView(QWidget):
 
         self.logger.info(f"📎 Выбран файл: {filename}")
 
+    @pyqtSlot()
     def _on_update_report(self):
         """Обработчик: обновление существующего отчёта."""
         if not self.file_path:
@@ -258,6 +243,7 @@ class CheckInvoicesView(QWidget):
         except Exception as e:
             self.logger.error(f"❌ Ошибка при обновлении отчёта: {e}")
 
+    @pyqtSlot()
     def _on_run_process(self):
         """Запуск процесса проверки."""
         if not self.file_path:
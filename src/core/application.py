@@ -23,8 +23,11 @@
 """
 
 # --- Стандартная библиотека ---
+import importlib
 import sys
+import threading
 
+from PyQt5.QtCore import QTimer
 from PyQt5.QtGui import QKeySequence
 # --- PyQt5 ---
 from PyQt5.QtWidgets import (
@@ -38,6 +41,12 @@ from src.core.logger import Logger      # Глобальный логгер с 
 from src.core.shortcuts import ShortcutManager
 from src.ui.main_window import MainWindow  # Главное окно с вкладками и боковым меню
 
+# Таблица диспетчеризации: тип вкладки → шаблон пути к модулю view
+TAB_MODULE_PATHS = {
+    "business_process": "src.buisness_processes.{}.view",  # Бизнес-процессы
+    "internal_app": "src.ui.apps.{}.view",                 # Встроенные приложения
+}
+
 
 class Application:
     """
@@ -79,6 +88,7 @@ class Application:
         self.widgets = {}
         self.qt_app = None
         self.shortcut_manager = None  # ← новый атрибут
+        self._pending_window_mode = None  # Последний отложенный режим окна (см. on_config_changed)
 
     def setup_config(self):
         """
@@ -200,18 +210,18 @@ class Application:
         - src.core.config.Config — для получения списка вкладок
         - src.ui.main_window.MainWindow — для добавления вкладок
         - PyQt5.QtWidgets.QWidget — базовый класс для всех view
-        - Динамические импорты: __import__, getattr
+        - Динамические импорты: sys.modules (быстрый путь), importlib.import_module
         """
 
         # === 2. Получаем конфигурацию вкладок из Config ===
-        # Метод get_tab_config() возвращает словарь:
+        # Метод get_tab_config() возвращает словарь TabSpec:
         # {
-        #   "check_invoices": {
-        #     "title": "Проверка накладных",
-        #     "type": "business_process",
-        #     "module": "check_invoices",
-        #     "class": "CheckInvoicesView"
-        #   },
+        #   "check_invoices": TabSpec(
+        #     title="Проверка накладных",
+        #     type="business_process",
+        #     module="check_invoices",
+        #     class_name="CheckInvoicesView"
+        #   ),
         #   ...
         # }
         tab_config = self.config.get_tab_config()
@@ -222,6 +232,16 @@ class Application:
         # Если не задан — возвращаем все ключи из tabs
         order = self.config.get_tab_order()
 
+        # Боковое меню перерисовываем один раз после добавления всех кнопок,
+        # а не после каждого addWidget
+        # Промежуточные перерисовки окна отключаем на время всей регистрации
+        self.main_window.setUpdatesEnabled(False)
+        sidebar = self.main_window.sidebar_layout.parentWidget()
+        sidebar.setUpdatesEnabled(False)
+
+        # Названия успешно зарегистрированных вкладок — логируются одной записью в конце
+        registered = []
+
         # === 4. Основной цикл: регистрация каждой вкладки ===
         for key in order:
             # Шаг 4.1: Проверяем, описана ли вкладка в config.tabs
@@ -229,41 +249,35 @@ class Application:
                 self.logger.warning(f"Вкладка '{key}' указана в tab_order, но не описана в tabs. Пропущено.")
                 continue
 
-            # Шаг 4.2: Получаем мета-данные вкладки
-            tab_info = tab_config[key]
-            title = tab_info["title"]  # Отображаемое название
-            tab_type = tab_info["type"]  # Тип: business_process / internal_app
-            module_name = tab_info["module"]  # Имя модуля (папки)
-            class_name = tab_info["class"]  # Имя класса в модуле
+            # Шаг 4.2: Получаем мета-данные вкладки:
+            # название, тип (business_process / internal_app), имя модуля (папки), имя класса
+            title, tab_type, module_name, class_name = tab_config[key]
 
             try:
-                # === 5. Определяем путь к модулю в зависимости от типа ===
-                if tab_type == "business_process":
-                    # Бизнес-процессы: src.business_processes.<module>.view
-                    module_path = f"src.buisness_processes.{module_name}.view"
-                elif tab_type == "internal_app":
-                    # Встроенные приложения: src.ui.apps.<module>.view
-                    module_path = f"src.ui.apps.{module_name}.view"
-                else:
+                # === 5. Определяем путь к модулю по таблице TAB_MODULE_PATHS ===
+                path_template = TAB_MODULE_PATHS.get(tab_type)
+                if path_template is None:
                     raise ValueError(f"Неизвестный тип вкладки: '{tab_type}'. "
-                                     f"Ожидалось: 'business_process' или 'internal_app'")
+                                     f"Ожидалось: {', '.join(TAB_MODULE_PATHS)}")
+                module_path = path_template.format(module_name)
 
-                # === 6. Динамически импортируем модуль ===
-                # __import__ загружает модуль по строке
-                # fromlist=[class_name] — гарантирует, что вернётся именно модуль view
-                module = __import__(module_path, fromlist=[class_name])
+                # === 6. Получаем модуль ===
+                # Уже импортированный модуль берём прямо из sys.modules,
+                # минуя механизм импорта; иначе — importlib.import_module
+                module = sys.modules.get(module_path) or importlib.import_module(module_path)
 
                 # === 7. Получаем класс из модуля по имени ===
-                # Например: getattr(module, "CheckInvoicesView")
-                view_class = getattr(module, class_name)
+                # Например: module.__dict__["CheckInvoicesView"]
+                view_class = module.__dict__[class_name]
 
                 # === 8. Создаём экземпляр виджета ===
                 # Все view-классы должны иметь интерфейс:
                 # __init__(config: Config, logger: Logger)
+                # и атрибут navigation_button (QPushButton)
                 widget = view_class(self.logger, self.config)
 
-                # Получаем кнопку навигации
-                nav_button = widget.get_navigation_button()
+                # Получаем кнопку навигации (создаётся в __init__ виджета)
+                nav_button = widget.navigation_button
                 nav_button.setCheckable(True)
 
                 # Подключаем сигнал: при клике — показать виджет
@@ -279,15 +293,15 @@ class Application:
                 # Нужно для дальнейшего доступа (например, навигация, активация)
                 self.widgets[title] = widget
 
-                # === 11. Логируем успешную регистрацию ===
-                self.logger.info(f"Виджет зарегистрирован: {title}")
+                # === 11. Запоминаем успешную регистрацию (лог — после цикла) ===
+                registered.append(title)
 
             # === 12. Обработка ошибок ===
             except ModuleNotFoundError as e:
                 # Модуль не найден — возможно, папка отсутствует
                 self.logger.error(f"Модуль не найден для вкладки '{title}' ({key}): {e}")
 
-            except AttributeError as e:
+            except (AttributeError, KeyError) as e:
                 # Класс не найден в модуле — опечатка в class_name или нет класса
                 self.logger.error(f"Класс '{class_name}' не найден в модуле '{module_path}': {e}")
 
@@ -300,18 +314,50 @@ class Application:
                 # Любая другая ошибка (например, ошибка в __init__ виджета)
                 self.logger.error(f"Неизвестная ошибка при создании виджета '{title}': {e}")
 
+        sidebar.setUpdatesEnabled(True)
+        sidebar.update()
+        self.main_window.setUpdatesEnabled(True)
+
         # === 13. Финальное логирование ===
-        self.logger.info(f"Регистрация вкладок завершена. Зарегистрировано: {len(self.widgets)} виджетов")
+        self.logger.info(f"Регистрация вкладок завершена. Зарегистрировано: {len(registered)} виджетов"
+                         + "".join(f"\n  - {title}" for title in registered))
 
     def on_config_changed(self, key: str, value):
+        """
+        Реагирует на сигнал Config.config_changed.
+
+        Примечание:
+        - 'window_mode' не применяется сразу: серия изменений подряд схлопывается
+          через QTimer.singleShot в один вызов _apply_window_mode() с последним значением
+        """
         if key == "full_log":
             self.main_window.show_logs_panel(value)
         elif key == 'window_mode':
-            if value["maximized"]:
-                self.main_window.showMaximized()  # ← Приоритет: развёрнутое окно
-            else:
-                self.main_window.showNormal()
-                self.main_window.resize(*value["window_size"])  # ← Только если не maximized
+            # Таймер уже запланирован — просто обновляем значение
+            if self._pending_window_mode is None:
+                QTimer.singleShot(50, self._apply_window_mode)
+            self._pending_window_mode = value
+
+    def on_settings_applied(self, payload: dict):
+        """
+        Реагирует на сигнал Config.settings_applied — пакет изменений из apply_settings().
+
+        Примечание:
+        - Каждый ключ пакета обрабатывается так же, как одиночный config_changed
+        """
+        for key, value in payload.items():
+            self.on_config_changed(key, value)
+
+    def _apply_window_mode(self):
+        """Применяет последний запрошенный режим окна и сбрасывает отложенное значение."""
+        value, self._pending_window_mode = self._pending_window_mode, None
+        if value is None:
+            return
+        if value["maximized"]:
+            self.main_window.showMaximized()  # ← Приоритет: развёрнутое окно
+        else:
+            self.main_window.showNormal()
+            self.main_window.resize(*value["window_size"])  # ← Только если не maximized
 
     def run(self):
         """
@@ -320,62 +366,83 @@ class Application:
         Шаги:
         1. Вызвать setup_config()
         2. Вызвать setup_logger()
+           - Если в настройках "parallel_startup": true — setup_logger() выполняется
+             в отдельном потоке, пока в главном потоке создаётся QApplication
         3. Передать настоящий logger в config.set_logger()
-        4. Вызвать setup_main_window()
+        4. Вызвать setup_main_window() и подключить GUI-обработчик логов (logger.setup_gui_handler())
         5. Вызвать register_business_processes()
         6. Вызвать build_navigation()
         7. Создать QApplication
         8. Показать главное окно
-        9. Запустить цикл событий: app.exec_()
+        9. Запустить цикл событий: app.exec_(), после выхода — logger.shutdown()
 
         Обработка ошибок:
         - Если на любом этапе произошла ошибка:
           * Залогировать её через self.logger (если доступен)
           * Показать QMessageBox с текстом ошибки
           * Завершить приложение с кодом 1
+
+        Примечание:
+        - QApplication всегда создаётся в главном потоке — этого требует Qt.
+          Параллельно с ним выполняется только работа без Qt-виджетов (открытие файла логов).
         """
         try:
             # Шаг 1
             self.setup_config()
 
             # Шаг 2
-            self.setup_logger()
+            if self.config.get("parallel_startup", False):
+                # Файл логов открывается в фоне, пока Qt загружает платформенные плагины
+                # Ошибка фонового потока сохраняется и пробрасывается в главном потоке как есть
+                logger_errors = []
+
+                def init_logger():
+                    try:
+                        self.setup_logger()
+                    except Exception as error:
+                        logger_errors.append(error)
+
+                logger_thread = threading.Thread(target=init_logger, name="logger-setup")
+                logger_thread.start()
+                self.qt_app = QApplication(sys.argv)
+                logger_thread.join()
+                if logger_errors:
+                    raise logger_errors[0]
+                if self.logger is None:
+                    raise RuntimeError("Logger не был инициализирован в фоновом потоке")
+            else:
+                self.setup_logger()
 
             # Шаг 3
             self.config.set_logger(self.logger)
             self.config.config_changed.connect(self.on_config_changed)
+            self.config.settings_applied.connect(self.on_settings_applied)
             # Шаг 4
-            self.qt_app = QApplication(sys.argv)
+            if self.qt_app is None:
+                self.qt_app = QApplication(sys.argv)
             self.setup_main_window()
             self.main_window.application = self  # ← для switch_to
+            # LogWidget уже подписан на log_signal — подключаем единственный GUI-обработчик
+            self.logger.setup_gui_handler()
 
             # Шаг 5
             # === 5. Зарегистрировать виджеты ===
             self.register_business_processes()
 
             # === Инициализация ShortcutManager ===
+            settings_widget = self.widgets.get("Настройки")
+            check_invoices_widget = self.widgets.get("Проверка накладных")
             self.shortcut_manager = ShortcutManager(
                 self.main_window,
                 self.logger,
                 self.config,
-                self.widgets.get("Настройки"),
-                self.widgets.get("Проверка накладных")
+                settings_widget,
+                check_invoices_widget
             )
 
             # === Подключаем переключение контекста ===
             # При смене вкладки — уведомляем ShortcutManager
-            def on_tab_switch(widget):
-                if hasattr(self, 'shortcut_manager'):
-                    self.shortcut_manager.on_widget_activated(widget)
-
-            # Оборачиваем switch_to, чтобы добавить колбэк
-            original_switch = self.main_window.switch_to
-
-            def wrapped_switch(widget):
-                original_switch(widget)
-                on_tab_switch(widget)
-
-            self.main_window.switch_to = wrapped_switch
+            self.main_window.tab_switched.connect(self.shortcut_manager.on_widget_activated)
 
             # После setup_main_window() и до main_window.show()
             self.main_window.show_logs_panel(self.config.get("full_log", False))
@@ -383,7 +450,9 @@ class Application:
             self.main_window.show()
             self.logger.info("GUI запущен")
 
-            sys.exit(self.qt_app.exec_())
+            exit_code = self.qt_app.exec_()
+            self.logger.shutdown()  # Дописать очередь логов в файл до выхода
+            sys.exit(exit_code)
 
         except Exception as e:
             # Если logger уже инициализирован — логируем
@@ -25,16 +25,70 @@ import sys
 from PyQt5.QtCore import pyqtSignal, QObject
 
 from src.core.logger import Logger
+from src.core.paths import ensure_dir
 import json
-import os
+import re
+from collections import deque
 from pathlib import Path
-from typing import Any, Dict, Optional
-from dotenv import load_dotenv
+from typing import Any, Dict, NamedTuple, Optional
+
+
+# orjson (C-реализация) — если установлен; иначе стандартный json.
+# Обе функции работают с байтами UTF-8; orjson.JSONDecodeError наследует json.JSONDecodeError.
+try:
+    import orjson
+
+    def _json_loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def _json_dumps(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _json_loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def _json_dumps(data: Any) -> bytes:
+        return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+# Допустимые уровни для Config.log (неизвестный уровень заменяется на 'info')
+_LOG_LEVELS: frozenset = frozenset(("debug", "info", "warning", "error"))
+
+# Ключи .env, которые извлекаются как секреты
+_SECRET_KEYS: frozenset = frozenset({
+    "DMS_USERNAME_SIB", "DMS_PASSWORD_SIB",
+    "DMS_USERNAME_URAL", "DMS_PASSWORD_URAL",
+    "DMS_BASE_URL",
+    "CRM_BASE_URL", "CRM_USERNAME", "CRM_PASSWORD",
+    "OPEN_ROUTER_API_KEY",
+})
+
+# Символы, срезаемые с краёв значения секрета: пробельные и кавычки
+_QUOTES_WS = ' \t\r\n"\''
+
+# Комментарий в конце значения без кавычек: '#' после любого пробельного символа
+_INLINE_COMMENT = re.compile(r'\s#')
+
+
+class TabSpec(NamedTuple):
+    """
+    Описание одной вкладки из config.tabs (неизменяемое, строится один раз при загрузке).
+
+    Атрибуты:
+    - title (str): Отображаемое название вкладки
+    - type (str): Тип вкладки: "business_process" или "internal_app"
+    - module (str): Имя модуля (папки) с view
+    - class_name (str): Имя класса view в модуле
+    """
+    title: str
+    type: str
+    module: str
+    class_name: str
 
 
 class Config(QObject):
 
-    config_changed = pyqtSignal(str, object)
+    config_changed = pyqtSignal(str, object)     # Одна настройка: (ключ, значение)
+    settings_applied = pyqtSignal(dict)          # Пакет из apply_settings(): {ключ: значение}
 
     def __init__(self, logger: Optional[Logger]):
         """
@@ -53,14 +107,18 @@ class Config(QObject):
         self.logger = logger
         self.data: Dict[str, Any] = {}
         self.secrets: Dict[str, str] = {}
+        self._tab_specs: Dict[str, TabSpec] = {}
+        self._last_emitted: Dict[str, Any] = {}  # Последние значения, отправленные apply_settings()
+        self._tab_order: Optional[list] = None  # Кэш get_tab_order(), сбрасывается в set()/_build_tab_specs()
 
-        self._log_buffer = []
+        self._log_buffer: deque = deque(maxlen=10_000)  # Ранние логи до привязки logger
+        self._log_methods: Dict[str, Any] = {}
         if not self.logger:
-            from src.core.logger import Logger
             Logger.log_before_gui("info", "Config: Logger ещё не готов — логирую в буфер")
 
         # Если logger уже есть — сбросить буфер
         if self.logger:
+            self._bind_log_methods()
             self._flush_buffer()
 
     def load(self):
@@ -72,11 +130,10 @@ class Config(QObject):
 
         Шаги:
         1. Создать директорию config/, если не существует.
-        2. Если config/settings.json существует:
-           - Загрузить в self.data
+        2. Если config/settings.json существует — загрузить в self.data.
         3. Если нет — создать дефолтный config с настройками по умолчанию.
         4. Если .env существует:
-           - Загрузить переменные окружения через dotenv
+           - Разобрать файл за один проход (_read_env_secrets), os.environ не изменяется
            - Сохранить нужные ключи (например, DMS_LOGIN, OPEN_ROUTER_API_KEY) в self.secrets
         5. Если .env нет — предупредить в логах, но продолжить (если не критично).
 
@@ -110,13 +167,24 @@ class Config(QObject):
         - Все пути нормализуются через Path.
         """
         # Шаг 1: Создать директорию config/, если не существует
-        self.config_path.parent.mkdir(exist_ok=True)
+        ensure_dir(self.config_path.parent)
 
-        # Шаг 2-3: Загрузить JSON или создать дефолтный
+        # Шаги 2-3: settings.json
+        self._load_settings_json()
+
+        # Шаги 4-5: .env
+        self.secrets = self._load_env()
+
+    def _load_settings_json(self):
+        """
+        Загружает settings.json в self.data или создаёт дефолтный конфиг,
+        затем строит TabSpec вкладок. Шаги 2-3 load().
+        """
         if self.config_path.exists():
             try:
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    self.data = json.load(f)
+                # Читаем файл целиком одним вызовом и разбираем байты (UTF-8)
+                with open(self.config_path, 'rb', buffering=65536) as f:
+                    self.data = _json_loads(f.read())
                 self.log("info", f"Конфигурация загружена из {self.config_path}")
             except (json.JSONDecodeError, OSError) as e:
                 self.log("error", f"Ошибка чтения settings.json: {e}. Создаём дефолтный конфиг.")
@@ -125,25 +193,55 @@ class Config(QObject):
             self.create_default_config()
             self.log("info", f"Файл {self.config_path} не найден. Создан дефолтный конфиг.")
 
-        # Шаг 4-5: Загрузить .env, если существует
-        if self.env_path.exists():
-            load_dotenv(self.env_path)
-            # Ключи, которые мы хотим извлечь как секреты
-            secret_keys = [
-                "DMS_USERNAME_SIB", "DMS_PASSWORD_SIB",
-                "DMS_USERNAME_URAL", "DMS_PASSWORD_URAL",
-                "DMS_BASE_URL",
-                "CRM_BASE_URL", "CRM_USERNAME", "CRM_PASSWORD",
-                "OPEN_ROUTER_API_KEY"
-            ]
-            for key in secret_keys:
-                value = os.getenv(key)
-                if value is not None:
-                    # Убираем кавычки и лишние пробелы
-                    self.secrets[key] = value.strip().strip('"\'')
-            self.log("info",f"Секреты загружены из {self.env_path}")
-        else:
+        self._build_tab_specs()
+
+    def _load_env(self) -> Dict[str, str]:
+        """
+        Читает секреты из .env, если файл существует. Шаги 4-5 load().
+
+        Returns:
+            Dict[str, str]: Секреты (пустой словарь, если .env нет)
+        """
+        if not self.env_path.exists():
             self.log("warning",f"Файл {self.env_path} не найден. Продолжаем без секретов (если не критично).")
+            return {}
+        secrets = self._read_env_secrets()
+        self.log("info",f"Секреты загружены из {self.env_path}")
+        return secrets
+
+    def _read_env_secrets(self) -> Dict[str, str]:
+        """
+        Читает из .env только ключи _SECRET_KEYS.
+
+        Поддерживается подмножество формата dotenv, которое нужно приложению:
+        - пустые строки и комментарии '#' пропускаются
+        - KEY=VALUE, пробелы вокруг '=' допустимы; префикс 'export ' отбрасывается
+        - значение в кавычках берётся до закрывающей кавычки ('#' внутри — часть значения)
+        - у значения без кавычек отбрасывается комментарий после пробела или табуляции
+        Подстановка переменных (${VAR}) не выполняется.
+
+        Returns:
+            Dict[str, str]: {ключ: значение без кавычек и крайних пробелов}
+        """
+        secrets = {}
+        for line in self.env_path.read_bytes().decode('utf-8-sig').splitlines():
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            if line.startswith('export') and line[6:7].isspace():
+                line = line[7:]
+            key, sep, raw_value = line.partition('=')
+            key = key.strip()
+            if not sep or key not in _SECRET_KEYS:
+                continue
+            value = raw_value.strip()
+            if value[:1] in ('"', "'"):
+                end = value.find(value[0], 1)
+                value = value[1:end] if end != -1 else value[1:]
+            else:
+                value = _INLINE_COMMENT.split(raw_value, 1)[0]
+            secrets[key] = value.strip(_QUOTES_WS)
+        return secrets
 
     def save(self):
         """
@@ -161,11 +259,14 @@ class Config(QObject):
         Примечание:
         - Вызывается при закрытии приложения или при нажатии "Сохранить" в SettingsWidget.
         - Использует indent=2 для читаемости.
+        - JSON сериализуется в память и записывается одним вызовом write().
         """
         try:
-            self.config_path.parent.mkdir(exist_ok=True)
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(self.data, f, ensure_ascii=False, indent=2)
+            ensure_dir(self.config_path.parent)
+            # Сериализуем целиком в память и пишем одним вызовом
+            content = _json_dumps(self.data)
+            with open(self.config_path, 'wb', buffering=65536) as f:
+                f.write(content)
             self.log("info", f"Конфигурация сохранена в {self.config_path}")
         except (OSError, IOError) as e:
             self.log("error", f"Не удалось сохранить конфигурацию: {e}")
@@ -210,6 +311,10 @@ class Config(QObject):
         - Используется в SettingsWidget при изменении настроек.
         """
         self.data[key] = value
+        if key == "tabs":
+            self._build_tab_specs()
+        elif key == "tab_order":
+            self._tab_order = None
 
     def get_secret(self, key: str, default: str = None) -> Optional[str]:
         """
@@ -243,10 +348,8 @@ class Config(QObject):
 
         Вызывается при инициализации.
         """
-        Path("config").mkdir(exist_ok=True)
-        Path("logs").mkdir(exist_ok=True)
-        Path("temp").mkdir(exist_ok=True)
-        Path("data").mkdir(exist_ok=True)
+        for directory in ("config", "logs", "temp", "data"):
+            ensure_dir(directory)
 
     def apply_settings(self):
         """
@@ -259,9 +362,13 @@ class Config(QObject):
         которые слушаются другими частями приложения (например, Application, MainWindow).
 
         🔧 Что делает:
-        1. Отправляет сигнал `config_changed` для ключей:
+        1. Собирает изменившиеся настройки в один словарь и отправляет его
+           одним сигналом `settings_applied`:
            - 'full_log' → чтобы показать/скрыть панель логов в GUI
-           - 'window_size' → чтобы изменить размер окна
+           - 'window_mode' → чтобы изменить размер окна
+           Ключ не попадает в пакет, если значение не изменилось с прошлого apply_settings()
+           (повторное "Сохранить" без изменений не перестраивает интерфейс).
+           Пустой пакет не отправляется.
         2. Не меняет уровень логирования в файле (всегда DEBUG), но управляет только отображением в GUI.
         3. Не сохраняет настройки в файл — это делает отдельный вызов config.save().
 
@@ -269,7 +376,8 @@ class Config(QObject):
             SettingsAppView._on_save_clicked()
                 → config.set("full_log", True)
                 → config.apply_settings()  # ← Этот метод
-                → config.config_changed.emit("full_log", True)
+                → config.settings_applied.emit({"full_log": True, ...})
+                → Application.on_settings_applied({"full_log": True, ...})
                 → Application.on_config_changed("full_log", True)
                 → MainWindow.show_logs_panel(True)
 
@@ -293,7 +401,8 @@ class Config(QObject):
 
         ⚠️ Важно:
         - Этот метод НЕ сохраняет настройки в файл. Для сохранения нужно вызвать config.save() отдельно.
-        - Сигнал config_changed должен быть подключён в Application (см. Application.run()).
+        - Сигнал settings_applied должен быть подключён в Application (см. Application.run()).
+        - config_changed остаётся для точечных изменений одной настройки.
 
         🛠️ Расширяемость:
         В будущем можно добавить:
@@ -301,28 +410,38 @@ class Config(QObject):
             - Язык интерфейса ('language')
             - Шрифт, автосохранение и т.д.
         Просто добавь:
-            self.config_changed.emit("new_setting", value)
+            payload["new_setting"] = value
 
         Returns:
             None
         """
         # 1. Управление панелью логов: показать/скрыть
+        payload: Dict[str, Any] = {}
         full_log = self.get("full_log", False)
-        self.config_changed.emit("full_log", full_log)
-        self.logger.info(
-            f"✅ Режим полного лога {'включён' if full_log else 'отключён'} — панель логов {'показана' if full_log else 'скрыта'}")
+        if self._last_emitted.get("full_log") != full_log:
+            self._last_emitted["full_log"] = full_log
+            payload["full_log"] = full_log
+            self.logger.info(
+                f"✅ Режим полного лога {'включён' if full_log else 'отключён'} — панель логов {'показана' if full_log else 'скрыта'}")
 
-        # 2. Применение размера окна
+        # 2. Применение размера окна (сравниваем по кортежу — список в window_size изменяемый)
         window_size = self.get("window_size", [1920, 1080])
         width, height = window_size[0], window_size[1]
         maximized = self.get("maximized", False)
-        self.config_changed.emit("window_mode", {"window_size": window_size, "maximized": maximized})
-        self.logger.info(f"✅ Размер окна изменён: {width}x{height}")
+        window_key = (tuple(window_size), maximized)
+        if self._last_emitted.get("window_mode") != window_key:
+            self._last_emitted["window_mode"] = window_key
+            payload["window_mode"] = {"window_size": window_size, "maximized": maximized}
+            self.logger.info(f"✅ Размер окна изменён: {width}x{height}")
 
         # 3. Другие настройки (заготовка на будущее)
         # Пример:
         # theme = self.get("theme", "light")
-        # self.config_changed.emit("theme", theme)
+        # payload["theme"] = theme
+
+        # 4. Одна отправка на все изменения
+        if payload:
+            self.settings_applied.emit(payload)
 
     def create_default_config(self):
         """
@@ -395,34 +514,48 @@ class Config(QObject):
         self.save()
         self.log("info", "Создан и сохранён дефолтный конфиг")
 
-    def get_tab_config(self) -> dict:
+    def get_tab_config(self) -> Dict[str, TabSpec]:
         """
         Возвращает конфигурацию всех вкладок приложения.
 
         Returns:
-            dict: {
-                "tab_key": {
-                    "title": "Отображаемое имя",
-                    "type": "business_process|internal_app",
-                    "module": "имя_модуля",
-                    "class": "ИмяКлассаView"
-                },
+            Dict[str, TabSpec]: {
+                "tab_key": TabSpec(title, type, module, class_name),
                 ...
             }
 
         Пример:
             config.get_tab_config() → {
-                "check_invoices": {
-                    "title": "Проверка накладных",
-                    "type": "business_process",
-                    "module": "check_invoices",
-                    "class": "CheckInvoicesView"
-                }
+                "check_invoices": TabSpec(
+                    title="Проверка накладных",
+                    type="business_process",
+                    module="check_invoices",
+                    class_name="CheckInvoicesView"
+                )
             }
 
+        Примечание:
+        - Словарь строится один раз в _build_tab_specs() при загрузке конфигурации,
+          а не разбирается из self.data["tabs"] при каждом вызове.
+
         Используется в Application для динамической регистрации вкладок.
         """
-        return self.get("tabs", {})
+        return self._tab_specs
+
+    def _build_tab_specs(self):
+        """
+        Преобразует self.data["tabs"] в словарь {ключ: TabSpec}.
+
+        Вкладки без обязательных полей (title, type, module, class) пропускаются с предупреждением.
+        """
+        specs = {}
+        for key, info in self.get("tabs", {}).items():
+            try:
+                specs[key] = TabSpec(info["title"], info["type"], info["module"], info["class"])
+            except (KeyError, TypeError) as e:
+                self.log("warning", f"Вкладка '{key}' описана некорректно (нет поля {e}). Пропущено.")
+        self._tab_specs = specs
+        self._tab_order = None  # Порядок по умолчанию зависит от набора вкладок
 
     def get_tab_order(self) -> list:
         """
@@ -435,13 +568,14 @@ class Config(QObject):
             config.get_tab_order() → ["check_invoices", "settings", "ai_chat"]
 
         Если не задан — возвращает все ключи из tabs.
-        """
-        order = self.get("tab_order")
-        if order:
-            return order
 
-        # Если порядок не задан — возвращаем все ключи
-        return list(self.get_tab_config().keys())
+        Примечание:
+        - Результат кэшируется до изменения "tabs" или "tab_order" через set()/load().
+        """
+        if self._tab_order is None:
+            # Если порядок не задан — берём все ключи вкладок
+            self._tab_order = self.get("tab_order") or list(self.get_tab_config().keys())
+        return self._tab_order
 
     def _buffer_log(self, level: str, message: str):
         """Сохраняет лог в буфер, если logger ещё не готов"""
@@ -449,12 +583,23 @@ class Config(QObject):
         # Всё равно выводим в консоль — чтобы видеть, даже если logger не инициализирован
         print(f"[{level.upper()}] {message}", file=sys.stderr)
 
+    def _bind_log_methods(self):
+        """Строит таблицу {уровень: метод логгера} — один раз при привязке logger"""
+        self._log_methods = {
+            "debug": self.logger.debug,
+            "info": self.logger.info,
+            "warning": self.logger.warning,
+            "error": self.logger.error,
+        }
+
     def _flush_buffer(self):
         """Сбрасывает буфер в настоящий логгер"""
         if self.logger:
-            for level, msg in self._log_buffer:
-                getattr(self.logger, level)(msg)
-            self._log_buffer.clear()
+            methods = self._log_methods
+            buffer = self._log_buffer
+            while buffer:
+                level, msg = buffer.popleft()
+                methods[level](msg)
 
     def log(self, level: str, message: str):
         """
@@ -466,13 +611,12 @@ class Config(QObject):
             message (str): Сообщение для логирования
         """
         level = level.lower()
-        if level not in ("debug", "info", "warning", "error"):
+        if level not in _LOG_LEVELS:
             level = "info"
 
         if self.logger:
-            getattr(self.logger, level)(message)
+            self._log_methods[level](message)
         else:
-            from src.core.logger import Logger
             Logger.log_before_gui(level, message)
 
     def set_logger(self, logger):
@@ -483,7 +627,7 @@ class Config(QObject):
             logger (Logger): Инициализированный глобальный логгер.
 
         Шаги:
-        1. Сохранить logger в self.logger.
+        1. Сохранить logger в self.logger и построить таблицу методов по уровням.
         2. Перенаправить все накопленные сообщения из буфера в настоящий логгер.
         3. Залогировать успешную привязку: "Config: Logger attached. X buffered messages flushed."
 
@@ -492,11 +636,15 @@ class Config(QObject):
         - Гарантирует, что никакие ранние логи не потеряются.
         """
         self.logger = logger
+        self._bind_log_methods()
 
         # Сбрасываем буфер
+        methods = self._log_methods
+        buffer = self._log_buffer
         flushed_count = 0
-        for level, message in self._log_buffer:
-            getattr(self.logger, level)(message)
+        while buffer:
+            level, message = buffer.popleft()
+            methods[level](message)
             flushed_count += 1
 
         # Логируем факт привязки — уже через настоящий файл
@@ -22,15 +22,92 @@
 Статус: Разработан
 """
 
+import atexit
 import logging
 import os
+import queue
 import sys
+import threading
+import time
+from collections import deque
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
+from src.core.paths import ensure_dir
 from src.core.signals import log_signal
 
+
+class _CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter, который вызывает strftime не чаще раза в секунду.
+
+    Строка "%Y-%m-%d %H:%M:%S" кэшируется по целой секунде record.created;
+    к ней дописываются только миллисекунды.
+    """
+
+    def __init__(self, fmt=None, datefmt=None):
+        super().__init__(fmt, datefmt)
+        self._cached_time = (None, "")  # (секунда, отформатированная строка)
+
+    def formatTime(self, record, datefmt=None):
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, text = self._cached_time
+        if cached_second != second:
+            text = time.strftime(self.default_time_format, self.converter(record.created))
+            self._cached_time = (second, text)
+        return self.default_msec_format % (text, record.msecs)
+
+
+class _BufferedFileHandler(logging.FileHandler):
+    """
+    FileHandler без flush() после каждой записи.
+
+    Строки копятся в буфере файла (64 КиБ); сброс на диск — сразу для ERROR и выше,
+    иначе по команде _IdleFlushQueueListener, когда очередь логов опустела.
+    Файл открывается на дозапись ("a") — существующий лог не обрезается.
+    """
+
+    buffer_size = 65536
+
+    def _open(self):
+        return self._builtin_open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                                  encoding=self.encoding, errors=self.errors)
+
+    def emit(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.ERROR:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class _IdleFlushQueueListener(QueueListener):
+    """
+    QueueListener, который сбрасывает буферы обработчиков, как только очередь опустела.
+
+    Пачка сообщений подряд пишется одним flush(), а последнее сообщение пачки
+    попадает на диск сразу, без ожидания таймера.
+    """
+
+    def dequeue(self, block):
+        try:
+            return self.queue.get_nowait()
+        except queue.Empty:
+            for handler in self.handlers:
+                handler.flush()
+            return self.queue.get(block)
+
+
 class Logger:
     _instance: Optional['Logger'] = None  # Статический экземпляр (синглтон)
-    _log_buffer = []  # Буфер для логов до подключения GUI
+    _log_buffer: deque = deque(maxlen=10_000)  # Буфер для логов до подключения GUI (старые вытесняются)
+    _lock = threading.Lock()  # Защищает только первое создание экземпляра
 
     def __new__(cls, *args, **kwargs):
         if cls._instance is None:
@@ -52,43 +129,71 @@ class Logger:
         - Конструктор защищён от повторного вызова (паттерн Синглтон).
         - Все классы приложения должны использовать Logger.get_instance().
         """
-        self._gui_handler = None
-        if hasattr(self, 'initialized') and self.initialized:
+        # Повторный вызов (Logger() у готового синглтона) ничего не делает и не сбрасывает GUI-обработчик
+        if getattr(self, 'initialized', False):
             return
 
-            # Создаём логгер
+        self._gui_handler = None
+
+        # Создаём логгер
         self.logger = logging.getLogger("AnalyticsAIAgent")
         self.logger.setLevel(getattr(logging, level.upper()))
         self.logger.handlers.clear()  # Убираем дубли
+        self.logger.propagate = False  # Не дублируем записи через root-логгер
 
         # Формат
-        formatter = logging.Formatter('%(asctime)s — %(levelname)s — %(message)s')
+        formatter = _CachedTimeFormatter('%(asctime)s — %(levelname)s — %(message)s')
 
-        # File Handler
-        os.makedirs(os.path.dirname(log_file), exist_ok=True)
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
+        # File Handler — пишет фоновый QueueListener, вызывающий поток только кладёт запись в очередь.
+        # flush() — на ERROR и когда очередь опустела, а не после каждой строки
+        ensure_dir(os.path.dirname(log_file) or ".")
+        file_handler = _BufferedFileHandler(log_file, mode='a', encoding='utf-8')
         file_handler.setFormatter(formatter)
-        self.logger.addHandler(file_handler)
-
-        # GUI Handler — только добавляем в логгер, не подключаем сигнал
-        gui_handler = logging.StreamHandler()
-        gui_handler.setFormatter(formatter)
-        self.logger.addHandler(gui_handler)
-
-        # Заменяем emit, чтобы отправлять в сигнал
-        def emit_via_signal(record):
-            log_signal.log.emit(record.levelname, record.getMessage())
-
-        gui_handler.emit = emit_via_signal
-
-        # Восстанавливаем буфер
-        for level, msg in self._log_buffer:
-            getattr(self.logger, level.lower())(msg)
-        self._log_buffer.clear()
+        self._queue: queue.Queue = queue.Queue(-1)
+        self._queue_handler = QueueHandler(self._queue)
+        self.logger.addHandler(self._queue_handler)
+        self._listener: Optional[QueueListener] = _IdleFlushQueueListener(self._queue, file_handler)
+        self._listener.start()
+        atexit.register(self.shutdown)
+
+        # GUI-обработчик подключается отдельно — через setup_gui_handler() после создания окна
+
+        # Восстанавливаем буфер (таблица методов строится один раз, а не getattr на каждое сообщение)
+        methods = {
+            "debug": self.logger.debug,
+            "info": self.logger.info,
+            "warning": self.logger.warning,
+            "error": self.logger.error,
+        }
+        buffer = self._log_buffer
+        while buffer:
+            level, msg = buffer.popleft()
+            methods.get(level.lower(), self.logger.info)(msg)
 
         # Флаг инициализации
         self.initialized = True
 
+    def shutdown(self):
+        """
+        Останавливает фоновую запись в файл: дописывает очередь и закрывает файл.
+
+        Примечание:
+        - Вызывается Application при выходе из цикла событий; дополнительно зарегистрирован в atexit.
+        - Повторный вызов безопасен.
+        - После остановки файловый обработчик подключается к логгеру напрямую:
+          записи из ещё работающих потоков пишутся в файл синхронно, а не теряются в очереди.
+          Файл закрывает logging.shutdown() при выходе из процесса.
+        """
+        listener, self._listener = self._listener, None
+        if listener is not None:
+            # Одна замена списка: каждая запись идёт либо в очередь (её дописывает stop()), либо в файл
+            self.logger.handlers = [
+                handler for handler in self.logger.handlers if handler is not self._queue_handler
+            ] + list(listener.handlers)
+            listener.stop()
+            for handler in listener.handlers:
+                handler.flush()
+
     def _emit_log(self, level, message):
         log_signal.log.emit(level, message)
 
@@ -110,9 +215,9 @@ class Logger:
             Logger: Единственный экземпляр.
 
         Шаги:
-        1. Если _instance не существует:
-           - Создать новый Logger с указанными параметрами.
-        2. Вернуть существующий _instance.
+        1. Если _instance уже существует — сразу вернуть его (без блокировки).
+        2. Иначе под cls._lock повторно проверить _instance и создать Logger
+           с указанными параметрами (double-checked locking).
         3. Если уровень изменился — обновить уровень (опционально, можно игнорировать).
 
         Примеры использования:
@@ -126,8 +231,15 @@ class Logger:
             # В FileService
             logger.error("Не удалось прочитать файл: invalid.xlsx")
         """
-        if cls._instance is None:
-            cls(log_file, level)
+        # Быстрый путь: экземпляр уже создан — без блокировки
+        instance = cls._instance
+        if instance is not None:
+            return instance
+
+        # Медленный путь (только первый вызов): двойная проверка под блокировкой
+        with cls._lock:
+            if cls._instance is None:
+                cls(log_file, level)
         return cls._instance
 
     def _setup_file_handler(self, log_file: str):
@@ -155,7 +267,7 @@ class Logger:
 
         # Явно создаём директорию
         try:
-            os.makedirs(log_dir, exist_ok=True)
+            ensure_dir(log_dir)
         except Exception as e:
             print(f"❌ Не удалось создать директорию логов: {log_dir} — {e}", file=sys.stderr)
             raise
@@ -200,27 +312,22 @@ class Logger:
 
             def emit(self, record):
                 try:
-                    msg = self.format(record)
-                    # Мы хотим только level и message, как в сигнале
-                    level = record.levelname
-                    message = record.getMessage()
-                    self.signal.log.emit(level, message)
+                    # В сигнал уходят только level и message — форматтер не нужен
+                    self.signal.log.emit(record.levelname, record.getMessage())
                 except Exception:
                     self.handleError(record)
 
         if self._gui_handler is None:
             self._gui_handler = GUIHandler(target_signal)
-            self._gui_handler.setFormatter(
-                logging.Formatter("%(levelname)s — %(message)s")
-            )
             self.logger.addHandler(self._gui_handler)
 
-    def debug(self, message: str):
+    def debug(self, message: str, *args):
         """
         Логирует отладочное сообщение.
 
         Args:
-            message (str): Текст сообщения.
+            message (str): Текст сообщения (может содержать %-подстановки).
+            *args: Аргументы для %-подстановки — форматируются, только если DEBUG включён.
 
         Используется для:
         - Детального отслеживания шагов (например, "Начало проверки накладной 12345")
@@ -228,20 +335,27 @@ class Logger:
         - Отладки алгоритмов
 
         Пример:
-            logger.debug(f"Обработка строки {row_index} из Excel")
+            logger.debug("Обработка строки %d из Excel", row_index)
 
         Выводится:
             - В файл
             - В GUI (если подключён)
+
+        Примечание:
+        - Если DEBUG отключён — возврат сразу, без создания LogRecord.
+        - f-строка в аргументе вычисляется всегда; в частых вызовах используйте %-стиль.
         """
-        self.logger.debug(message)
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        self.logger.debug(message, *args)
 
-    def info(self, message: str):
+    def info(self, message: str, *args):
         """
         Логирует информационное сообщение.
 
         Args:
-            message (str): Текст сообщения.
+            message (str): Текст сообщения (может содержать %-подстановки).
+            *args: Аргументы для %-подстановки — форматируются, только если INFO включён.
 
         Используется для:
         - Старт/стоп процессов
@@ -252,14 +366,17 @@ class Logger:
         Пример:
             logger.info("Процесс проверки накладных завершён")
         """
-        self.logger.info(message)
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        self.logger.info(message, *args)
 
-    def warning(self, message: str):
+    def warning(self, message: str, *args):
         """
         Логирует предупреждение (не критичная ошибка).
 
         Args:
-            message (str): Текст сообщения.
+            message (str): Текст сообщения (может содержать %-подстановки).
+            *args: Аргументы для %-подстановки — форматируются, только если WARNING включён.
 
         Используется для:
         - Накладная не найдена
@@ -270,15 +387,18 @@ class Logger:
         Пример:
             logger.warning(f"Накладная {number} не найдена в DMS")
         """
-        self.logger.warning(message)
+        if not self.logger.isEnabledFor(logging.WARNING):
+            return
+        self.logger.warning(message, *args)
 
 
-    def error(self, message: str):
+    def error(self, message: str, *args):
         """
         Логирует критическую ошибку.
 
         Args:
-            message (str): Текст сообщения.
+            message (str): Текст сообщения (может содержать %-подстановки).
+            *args: Аргументы для %-подстановки — форматируются, только если ERROR включён.
 
         Используется для:
         - Сбой авторизации
@@ -293,4 +413,6 @@ class Logger:
         - Такие ошибки должны быть видны пользователю.
         - Должны сохраняться в файл и отображаться в LogWidget.
         """
-        self.logger.error(message)
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
+        self.logger.error(message, *args)
@@ -0,0 +1,54 @@
+"""
+Модуль: paths.py
+Описание: Создание рабочих директорий приложения (config/, logs/, temp/, data/).
+
+Назначение:
+- Единая точка создания директорий для Config и Logger.
+- Уже созданные директории запоминаются: повторный вызов — одна проверка is_dir()
+  вместо mkdir по всей цепочке родителей.
+- Если запомненную директорию удалили во время работы, она создаётся заново.
+
+Архитектурная роль:
+- Утилита слоя core, не зависит от других модулей приложения.
+
+Версия: v0.1
+Автор: Боряков
+Дата: 15.10.2026
+Статус: Разработан
+"""
+
+import os
+from pathlib import Path
+from typing import Set, Union
+
+
+# Абсолютные пути директорий, уже созданных через ensure_dir
+_ensured_dirs: Set[str] = set()
+
+
+def ensure_dir(path: Union[str, Path]) -> Path:
+    """
+    Создаёт директорию (с родителями), если её нет.
+
+    Примечание:
+    - Для уже созданной директории проверяется только is_dir();
+      mkdir вызывается, если директории нет (в том числе удалённой после создания).
+
+    Args:
+        path (str | Path): Путь к директории (например, "logs")
+
+    Returns:
+        Path: Тот же путь в виде Path
+
+    Пример:
+        ensure_dir("logs")
+        ensure_dir(Path(log_file).parent)
+    """
+    path = Path(path)
+    key = os.path.abspath(path)
+    if key in _ensured_dirs and path.is_dir():
+        return path
+
+    path.mkdir(parents=True, exist_ok=True)
+    _ensured_dirs.add(key)
+    return path
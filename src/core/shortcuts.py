@@ -20,13 +20,14 @@
 Статус: Разработан
 """
 
-from PyQt5.QtWidgets import QShortcut
+from PyQt5.QtWidgets import QShortcut, QWidget
 from PyQt5.QtGui import QKeySequence
-from PyQt5.QtCore import QObject
+from PyQt5.QtCore import QObject, pyqtSlot
 
+from dataclasses import dataclass
 from src.core.config import Config
 from src.core.logger import Logger
-from typing import TYPE_CHECKING, Optional, Dict, Any
+from typing import TYPE_CHECKING, Optional, Dict, Any, Callable
 
 if TYPE_CHECKING:
     from src.ui.main_window import MainWindow
@@ -34,6 +35,37 @@ if TYPE_CHECKING:
     from src.buisness_processes.check_invoices.view import CheckInvoicesView
 
 
+# Разобранные комбинации клавиш: строка → QKeySequence (разбор строки — один раз на комбинацию)
+_KEY_SEQUENCES: Dict[str, QKeySequence] = {}
+
+
+def _key_sequence(key_sequence: str) -> QKeySequence:
+    """Возвращает QKeySequence для строки вида "Ctrl+S" из кэша, разбирая её только при первом обращении."""
+    sequence = _KEY_SEQUENCES.get(key_sequence)
+    if sequence is None:
+        sequence = _KEY_SEQUENCES[key_sequence] = QKeySequence(key_sequence)
+    return sequence
+
+
+@dataclass(slots=True)
+class ShortcutItem:
+    """
+    Запись о зарегистрированном шорткате.
+
+    Атрибуты:
+    - shortcut (QShortcut): объект Qt
+    - key (str): комбинация клавиш, например "Ctrl+S"
+    - callback (Callable): обработчик activated
+    - description (str): описание для справки
+    - context (QWidget | None): вкладка, при которой шорткат активен; None — глобальный
+    """
+    shortcut: QShortcut
+    key: str
+    callback: Callable
+    description: str
+    context: Optional[QWidget]
+
+
 class ShortcutManager(QObject):
     """
     Менеджер горячих клавиш приложения.
@@ -43,8 +75,9 @@ class ShortcutManager(QObject):
     - settings_widget (SettingsAppView): ссылка на вкладку настроек (для контекста)
     - check_invoices_widget (CheckInvoicesView): ссылка на вкладку проверки (для контекста)
     - config (Config): опционально — для кастомных шорткатов в будущем
-    - shortcuts (list): список всех зарегистрированных шорткатов
+    - shortcuts (list[ShortcutItem]): список всех зарегистрированных шорткатов
     - context_widgets (dict): сопоставление виджетов и их контекстных шорткатов
+    - _current (QWidget | None): активная вкладка — обновляется в on_widget_activated()
     """
 
     def __init__(self, main_window, logger: Logger, config: Config, settings_widget=None, check_invoices_widget=None):
@@ -56,6 +89,7 @@ class ShortcutManager(QObject):
         self.config = config
         self.shortcuts = []
         self.context_widgets = {}
+        self._current: Optional[QWidget] = main_window.current_widget()
 
         # Регистрируем контекстные виджеты
         if self.check_invoices_widget:
@@ -106,33 +140,21 @@ class ShortcutManager(QObject):
 
     def _add_shortcut(self, key_sequence: str, callback, description: str = ""):
         """Унифицированное добавление глобального шортката."""
-        shortcut = QShortcut(QKeySequence(key_sequence), self.main_window)
+        shortcut = QShortcut(_key_sequence(key_sequence), self.main_window)
         shortcut.activated.connect(callback)
         shortcut.setEnabled(True)
 
-        shortcut_item = {
-            "shortcut": shortcut,
-            "key": key_sequence,
-            "callback": callback,
-            "description": description,
-            "context": None  # глобальный
-        }
+        shortcut_item = ShortcutItem(shortcut, key_sequence, callback, description, context=None)  # глобальный
         self.shortcuts.append(shortcut_item)
         self.logger.info(f"⚡ Шорткат зарегистрирован: {key_sequence} → {description}")
 
     def _add_context_shortcut(self, widget, key_sequence: str, callback, description: str = ""):
         """Добавляет контекстный шорткат, который активен только при активации виджета."""
-        shortcut = QShortcut(QKeySequence(key_sequence), self.main_window)
+        shortcut = QShortcut(_key_sequence(key_sequence), self.main_window)
         shortcut.activated.connect(callback)
         shortcut.setEnabled(False)  # изначально отключён
 
-        shortcut_item = {
-            "shortcut": shortcut,
-            "key": key_sequence,
-            "callback": callback,
-            "description": description,
-            "context": widget
-        }
+        shortcut_item = ShortcutItem(shortcut, key_sequence, callback, description, context=widget)
         self.shortcuts.append(shortcut_item)
 
         # Сохраняем для быстрого доступа
@@ -140,67 +162,82 @@ class ShortcutManager(QObject):
             self.context_widgets[widget] = []
         self.context_widgets[widget].append(shortcut_item)
 
+    @pyqtSlot()
     def _on_open_settings(self):
         """Ctrl+Y: открывает вкладку 'Настройки'."""
         if self.settings_widget:
             self.main_window.switch_to(self.settings_widget)
 
+    @pyqtSlot()
     def _on_open_check_invoices(self):
         """Ctrl+I: открывает вкладку 'Проверка накладных'."""
         if self.check_invoices_widget:
             self.main_window.switch_to(self.check_invoices_widget)
 
+    @pyqtSlot()
     def _on_browse_file(self):
         """Ctrl+F: вызывает выбор файла (только если активна вкладка проверки)."""
         if self._is_active(self.check_invoices_widget):
             self.check_invoices_widget._on_browse_file()
 
+    @pyqtSlot()
     def _on_run_process(self):
         """Ctrl+E: запускает проверку (только если активна вкладка проверки)."""
         if self._is_active(self.check_invoices_widget):
             self.check_invoices_widget._on_run_process()
 
+    @pyqtSlot()
     def _on_update_report(self):
         """Ctrl+R: запускает обновление загруженного отчёта (только если активна вкладка проверки)."""
         if self.check_invoices_widget:
             self.check_invoices_widget._on_update_report()
 
+    @pyqtSlot()
     def _on_save_settings(self):
         """Ctrl+S: сохраняет настройки (только если активна вкладка настроек)."""
         if self._is_active(self.settings_widget):
             self.settings_widget._on_save_clicked()
 
+    @pyqtSlot()
     def _on_quit_application(self):
         """Ctrl+Q: закрывает приложение."""
         self.main_window.close()
 
     def _is_active(self, widget) -> bool:
-        """Проверяет, активен ли виджет."""
-        return self.main_window.current_widget() == widget
+        """Проверяет, активен ли виджет (сравнение по идентичности с закэшированной вкладкой)."""
+        return widget is not None and self._current is widget
 
+    @pyqtSlot(QWidget)
     def on_widget_activated(self, widget):
         """
         Вызывается при активации вкладки.
         Включает контекстные шорткаты для этого виджета.
+
+        Примечание:
+        - Включены всегда только шорткаты текущей вкладки, поэтому отключаются
+          лишь шорткаты предыдущей — без обхода всего списка self.shortcuts.
         """
-        # Сначала отключаем все контекстные
-        self._deactivate_all_context_shortcuts()
+        previous, self._current = self._current, widget
+
+        # Отключаем контекстные шорткаты предыдущей вкладки
+        if previous is not widget:
+            for item in self.context_widgets.get(previous, ()):
+                item.shortcut.setEnabled(False)
 
         # Включаем для текущего
-        if widget in self.context_widgets:
-            for item in self.context_widgets[widget]:
-                item["shortcut"].setEnabled(True)
+        for item in self.context_widgets.get(widget, ()):
+            item.shortcut.setEnabled(True)
 
     def _deactivate_all_context_shortcuts(self):
         """Отключает все контекстные шорткаты."""
-        for item in self.shortcuts:
-            if item["context"] is not None:
-                item["shortcut"].setEnabled(False)
+        for items in self.context_widgets.values():
+            for item in items:
+                item.shortcut.setEnabled(False)
 
     def get_shortcuts_info(self):
         """Возвращает список всех шорткатов (для отладки или справки)."""
         return [
-            {"Клавиши": s["key"], "Описание": s["description"], "Тип": "Контекстный" if s["context"] else "Глобальный"}
+            {"Клавиши": s.key, "Описание": s.description, "Тип": "Контекстный" if s.context else "Глобальный"}
             for s in self.shortcuts
         ]
 
@@ -208,7 +245,7 @@ class ShortcutManager(QObject):
         """Отключает все шорткаты (например, при деинициализации)."""
         for item in self.shortcuts:
             try:
-                item["shortcut"].activated.disconnect()
+                item.shortcut.activated.disconnect()
             except:
                 pass
         self.shortcuts.clear()
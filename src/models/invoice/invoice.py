@@ -27,7 +27,7 @@ from enum import Enum
 from typing import Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Invoice:
     """
     Сущность "Накладная" — полная копия строки из Excel.
@@ -45,6 +45,7 @@ class Invoice:
     Примечание:
     - Это **исходные данные**, не результат проверки.
     - Поля found_in_dms, error_message, status — добавляются позже в процессе.
+    - slots=True: у экземпляров нет __dict__ — меньше памяти при массовой загрузке.
     """
 
     # === Данные из Excel ===
@@ -65,7 +66,7 @@ class CheckStatus(Enum):
     ERROR = "error"
     UNKNOWN = "unknown"
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CheckedInvoice:
     """Накладная со статусом"""
     invoice: Invoice
@@ -10,7 +10,10 @@
 from typing import List, Dict, Optional
 from dataclasses import asdict
 from .invoice import Invoice
-from .invoice_regions import INVOICE_PREFIX_REGIONS, get_region_by_prefix, get_city_by_prefix
+from .invoice_regions import PREFIX_TABLE
+
+# Маркер отсутствующего ключа в строке (None — допустимое значение поля)
+_MISSING = object()
 
 
 class InvoiceFactory:
@@ -52,41 +55,53 @@ class InvoiceFactory:
         Returns:
             Invoice или None, если обязательные поля отсутствуют.
         """
-        try:
-            number = str(row["number"]).strip()
-            crm_id = str(row["crm_id"]).strip()
-            address = str(row["address"]).strip()
-
-            # Парсим суммы
-            isa_amount = float(row["isa_amount"]) if row["isa_amount"] not in (None, "") else 0.0
-            sfa_amount = float(row["sfa_amount"]) if row["sfa_amount"] not in (None, "") else None
+        number = row.get("number", _MISSING)
+        crm_id = row.get("crm_id", _MISSING)
+        address = row.get("address", _MISSING)
+        isa_raw = row.get("isa_amount", _MISSING)
+        sfa_raw = row.get("sfa_amount", _MISSING)
+        if (number is _MISSING or crm_id is _MISSING or address is _MISSING
+                or isa_raw is _MISSING or sfa_raw is _MISSING):
+            return None
 
-            # Извлечение префикса
-            prefix = InvoiceFactory._extract_prefix(number)
-            if not prefix:
-                return None
+        number = str(number).strip()
 
-            # Определение региона
-            region = get_region_by_prefix(prefix)
-            if not region:
+        # Префикс, регион и города — одной выборкой из PREFIX_TABLE ("XX/", затем "X-")
+        prefix = number[:3]
+        meta = PREFIX_TABLE.get(prefix)
+        if meta is None:
+            prefix = number[:2]
+            meta = PREFIX_TABLE.get(prefix)
+            if meta is None:
                 return None
+        region, main_city, alt_city = meta
 
-            # Определение города доставки
-            delivery_city = InvoiceFactory._determine_delivery_city(prefix, address)
-
-            return Invoice(
-                number=number,
-                crm_id=crm_id,
-                address=address,
-                isa_amount=isa_amount,
-                sfa_amount=sfa_amount,
-                prefix=prefix,
-                region=region,
-                delivery_city=delivery_city,
-            )
-        except (KeyError, ValueError, TypeError):
+        # Парсим суммы — исключение возможно только здесь
+        try:
+            isa_amount = float(isa_raw) if isa_raw not in (None, "") else 0.0
+            sfa_amount = float(sfa_raw) if sfa_raw not in (None, "") else None
+        except (ValueError, TypeError):
             return None
 
+        address = str(address).strip()
+
+        # Город доставки — то же правило, что в _determine_delivery_city
+        if alt_city and ((alt_city in address) or ("Томск" in address)):
+            delivery_city = alt_city
+        else:
+            delivery_city = main_city
+
+        return Invoice(
+            number=number,
+            crm_id=str(crm_id).strip(),
+            address=address,
+            isa_amount=isa_amount,
+            sfa_amount=sfa_amount,
+            prefix=prefix,
+            region=region,
+            delivery_city=delivery_city,
+        )
+
     @staticmethod
     def _extract_prefix(number: str) -> Optional[str]:
         """
@@ -99,12 +114,16 @@ class InvoiceFactory:
 
         Returns:
             str or None: Префикс, например "01/", "И-", "Ч-"
+
+        Примечание:
+        - Допустимые префиксы — ключи PREFIX_TABLE (3 символа "XX/" или 2 символа "X-"),
+          проверка — два поиска в словаре вместо перебора кортежей startswith.
         """
-        if number.startswith(("01/", "02/", "04/", "05/", "06/", "07/")):
-            return number[:3]
-        elif number.startswith(("Е-", "Б-", "К-", "И-", "У-", "Ч-")):
-            return number[:2]
-        return None
+        prefix = number[:3]
+        if prefix in PREFIX_TABLE:
+            return prefix
+        prefix = number[:2]
+        return prefix if prefix in PREFIX_TABLE else None
 
     @staticmethod
     def _determine_delivery_city(prefix: str, address: str) -> str:
@@ -122,9 +141,7 @@ class InvoiceFactory:
         Returns:
             str: Город доставки.
         """
-        info = INVOICE_PREFIX_REGIONS.get(prefix, {})
-        main_city = info.get("city")
-        alt_city = info.get("alternative_city")
+        _, main_city, alt_city = PREFIX_TABLE.get(prefix, (None, None, None))
 
         # Если нет альтернативного города — возвращаем основной
         if not alt_city:
@@ -8,7 +8,7 @@
 
 Архитектурная роль:
 - Справочник (catalog), часть домена.
-- Не изменяется в рантайме.
+- Не изменяется в рантайме (INVOICE_PREFIX_REGIONS — read-only MappingProxyType).
 
 Версия: v0.1
 Автор: Боряков
@@ -16,26 +16,37 @@
 Статус: Полностью готов
 """
 
-from typing import Optional, Dict
+from types import MappingProxyType
+from typing import Optional, Dict, Mapping, Tuple
 
-# Полный маппинг префиксов → метаданные
-INVOICE_PREFIX_REGIONS: Dict[str, Dict[str, str]] = {
+# Справочник: префикс → (регион, основной город, альтернативный город или None).
+# Кортежи неизменяемы; одна выборка из словаря даёт все метаданные префикса.
+PREFIX_TABLE: Dict[str, Tuple[str, str, Optional[str]]] = {
     # Сибирь
-    "01/": {"city": "Красноярск", "region": "siberia"},
-    "02/": {"city": "Абакан", "region": "siberia"},
-    "04/": {"city": "Новокузнецк", "region": "siberia", "alternative_city": "Новосибирск"},
-    "05/": {"city": "Новосибирск", "region": "siberia"},
-    "06/": {"city": "Омск", "region": "siberia"},
-    "Е-": {"city": "Омск", "region": "siberia"},
-    "Б-": {"city": "Абакан", "region": "siberia"},
-    "К-": {"city": "Новосибирск", "region": "siberia"},
-    "И-": {"city": "Новокузнецк", "region": "siberia"},
-    "У-": {"city": "Красноярск", "region": "siberia"},
+    "01/": ("siberia", "Красноярск", None),
+    "02/": ("siberia", "Абакан", None),
+    "04/": ("siberia", "Новокузнецк", "Новосибирск"),
+    "05/": ("siberia", "Новосибирск", None),
+    "06/": ("siberia", "Омск", None),
+    "Е-": ("siberia", "Омск", None),
+    "Б-": ("siberia", "Абакан", None),
+    "К-": ("siberia", "Новосибирск", None),
+    "И-": ("siberia", "Новокузнецк", None),
+    "У-": ("siberia", "Красноярск", None),
     # Урал
-    "07/": {"city": "Челябинск", "region": "ural", "alternative_city": "Курган"},
-    "Ч-": {"city": "Челябинск", "region": "ural"},
+    "07/": ("ural", "Челябинск", "Курган"),
+    "Ч-": ("ural", "Челябинск", None),
 }
 
+# Полный маппинг префиксов → метаданные (только для чтения, строится из PREFIX_TABLE).
+# Формат прежний: {"city": ..., "region": ..., ["alternative_city": ...]}
+INVOICE_PREFIX_REGIONS: Mapping[str, Mapping[str, str]] = MappingProxyType({
+    prefix: MappingProxyType(
+        {"city": city, "region": region, **({"alternative_city": alt_city} if alt_city else {})}
+    )
+    for prefix, (region, city, alt_city) in PREFIX_TABLE.items()
+})
+
 
 def get_region_by_prefix(prefix: str) -> Optional[str]:
     """
@@ -50,8 +61,8 @@ def get_region_by_prefix(prefix: str) -> Optional[str]:
     Используется в:
         InvoiceFactory.extract_prefix → get_region_by_prefix
     """
-    info = INVOICE_PREFIX_REGIONS.get(prefix)
-    return info["region"] if info else None
+    meta = PREFIX_TABLE.get(prefix)
+    return meta[0] if meta else None
 
 
 def get_city_by_prefix(prefix: str) -> Optional[str]:
@@ -67,5 +78,5 @@ def get_city_by_prefix(prefix: str) -> Optional[str]:
     Используется в:
         UI (отображение города в таблице)
     """
-    info = INVOICE_PREFIX_REGIONS.get(prefix)
-    return info["city"] if info else None
\ No newline at end of file
+    meta = PREFIX_TABLE.get(prefix)
+    return meta[1] if meta else None
\ No newline at end of file
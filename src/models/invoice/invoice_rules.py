@@ -13,18 +13,32 @@
 
 Зависимости:
 - models.invoice.invoice
+
+Примечание:
+- Каждое правило есть в двух формах: для одного Invoice и *_mask — для
+  DataFrame целиком (одно векторное сравнение вместо N вызовов в цикле).
 """
 
+from typing import TYPE_CHECKING
+
 from .invoice import Invoice
+from .invoice_regions import PREFIX_TABLE
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+# Регионы, известные по префиксам номеров ("unknown" сюда не входит)
+_VALID_REGIONS = frozenset(region for region, _, _ in PREFIX_TABLE.values())
 
 
 def should_process(invoice: Invoice) -> bool:
     """
     Проверяет, должна ли накладная участвовать в проверке.
 
-    Условие:
+    Условие (совпадает с FilterInvoices.filter_invoices):
     - Сумма в ISA ≠ 0
-    - Сумма в SFA не пустая (не None)
+    - Сумма в SFA пустая (None) — накладной ещё нет в SFA
 
     Args:
         invoice (Invoice): Объект накладной
@@ -35,7 +49,7 @@ def should_process(invoice: Invoice) -> bool:
     Используется в:
         FileService.load_and_filter_invoices()
     """
-    pass
+    return invoice.isa_amount != 0 and invoice.sfa_amount is None
 
 
 def is_from_region(invoice: Invoice, region: str) -> bool:
@@ -53,7 +67,7 @@ def is_from_region(invoice: Invoice, region: str) -> bool:
         CheckInvoicesProcess (группировка)
         ExcelStyleService (подсветка)
     """
-    pass
+    return invoice.region == region
 
 
 def should_highlight_as_other_region(invoice: Invoice, current_region: str) -> bool:
@@ -70,7 +84,8 @@ def should_highlight_as_other_region(invoice: Invoice, current_region: str) -> b
     Используется в:
         ExcelStyleService (цветовая заливка)
     """
-    pass
+    region = invoice.region
+    return region != current_region and region in _VALID_REGIONS
 
 
 def is_valid_for_dms_check(invoice: Invoice) -> bool:
@@ -88,4 +103,56 @@ def is_valid_for_dms_check(invoice: Invoice) -> bool:
     Используется в:
         CheckInvoicesProcess (финальная проверка перед поиском)
     """
-    pass
\ No newline at end of file
+    return should_process(invoice)
+
+
+# === Векторные версии правил (для DataFrame) ===
+
+def should_process_mask(df: "pd.DataFrame") -> "pd.Series":
+    """
+    Векторная версия should_process: маска строк, которые нужно проверять.
+
+    Примечание:
+    - Как и FilterInvoices.filter_invoices, принимает суммы строками ("0", "0.0"):
+      ISA пустая → строка не подходит, ISA не число → считается не нулём.
+
+    Args:
+        df (pd.DataFrame): Таблица с колонками "isa_amount" и "sfa_amount"
+
+    Returns:
+        pd.Series: Булева маска (True — строка обрабатывается)
+    """
+    import pandas as pd
+
+    isa = df["isa_amount"]
+    isa_nonzero = isa.notna() & (pd.to_numeric(isa, errors="coerce") != 0)
+    return isa_nonzero & df["sfa_amount"].isna()
+
+
+def is_from_region_mask(df: "pd.DataFrame", region: str) -> "pd.Series":
+    """
+    Векторная версия is_from_region.
+
+    Args:
+        df (pd.DataFrame): Таблица с колонкой "region"
+        region (str): Регион ("siberia", "ural")
+
+    Returns:
+        pd.Series: Булева маска (True — строка из указанного региона)
+    """
+    return df["region"] == region
+
+
+def should_highlight_as_other_region_mask(df: "pd.DataFrame", current_region: str) -> "pd.Series":
+    """
+    Векторная версия should_highlight_as_other_region.
+
+    Args:
+        df (pd.DataFrame): Таблица с колонкой "region"
+        current_region (str): Регион, который сейчас проверяется
+
+    Returns:
+        pd.Series: Булева маска (True — подсвечивать как "не свой регион")
+    """
+    region = df["region"]
+    return (region != current_region) & region.isin(_VALID_REGIONS)
@@ -3,7 +3,7 @@ from typing import Optional, List
 from datetime import datetime, timedelta
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     title: str  # Название задачи
     description: str  # Описание
@@ -1,8 +1,13 @@
+import re
 from dataclasses import dataclass
 from typing import Optional
 from enum import Enum
 
 
+# Почтовый индекс в начале адреса (6 цифр + пробелы)
+_INDEX_RE = re.compile(r'^\d{6}\s*')
+
+
 class PointStatus(Enum):
     PENDING = "pending"  # Ожидает обработки
     PROCESSING = "processing"  # В процессе создания
@@ -10,7 +15,7 @@ class PointStatus(Enum):
     ERROR = "error"  # Ошибка при создании
 
 
-@dataclass
+@dataclass(slots=True)
 class TradePoint:
     # Базовые поля от пользователя
     name_1c: str  # Название в 1С (полное)
@@ -42,5 +47,4 @@ class TradePoint:
     @property
     def clean_address(self) -> str:
         """Адрес без индекса"""
-        import re
-        return re.sub(r'^\d{6}\s*', '', self.full_address).strip()
\ No newline at end of file
+        return _INDEX_RE.sub('', self.full_address).strip()
\ No newline at end of file
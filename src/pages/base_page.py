@@ -1,13 +1,88 @@
 # src/pages/base_page.py
 
+from selenium.common.exceptions import (
+    JavascriptException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+# Таймауты ожиданий (сек) — единые для всех страниц
+SHORT_TIMEOUT = 3
+LONG_TIMEOUT = 20
+SHORT_POLL = 0.2
+LONG_POLL = 0.3
+LOAD_TIMEOUT = 10
+LOAD_POLL = 0.1
+
+# Вызов JS-помощника по имени: [true, результат] или [false], если помощник не установлен
+_HELPER_CALL = (
+    "const h = window.__pageHelpers;"
+    " return (h && h.{name}) ? [true, h.{name}(...arguments)] : [false];"
+)
+
+# Поиск видимого элемента по тексту целиком в браузере (один вызов execute_script).
+# Аргументы: тип локатора ('xpath' или CSS-селектор), значение, текст, точное совпадение
+_FIND_BY_TEXT_JS = """
+const [by, value, text, exact] = arguments;
+let nodes;
+if (by === 'xpath') {
+    const found = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    nodes = Array.from({length: found.snapshotLength}, (_, i) => found.snapshotItem(i));
+} else {
+    nodes = document.querySelectorAll(value);
+}
+for (const el of nodes) {
+    const elText = (el.innerText || '').trim().replace(/\\s+/g, ' ');
+    if ((exact ? elText === text : elText.includes(text)) && el.getClientRects().length > 0) {
+        return el;
+    }
+}
+return null;
+"""
+
+# Локаторы, которые переводятся в CSS-селектор для _FIND_BY_TEXT_JS
+_CSS_PREFIXES = {By.CSS_SELECTOR: "", By.CLASS_NAME: ".", By.ID: "#", By.TAG_NAME: ""}
+
+# Ожидаемые ошибки поиска/ожидания элемента: «элемента нет» — это ответ, а не сбой
+LOOKUP_ERRORS = (TimeoutException, NoSuchElementException, StaleElementReferenceException)
+
+
+def retry_stale(fn, tries=3):
+    """
+    Выполняет fn(), повторяя вызов, если элемент устарел (DOM перерисован).
+    fn должна искать элемент заново от корня документа — иначе повтор бесполезен.
+    Последняя попытка пробрасывает исключение наружу.
+    """
+    for _ in range(tries - 1):
+        try:
+            return fn()
+        except StaleElementReferenceException:
+            pass
+    return fn()
+
+
 class BasePage:
+    # JS-помощники: имя → функция. Устанавливаются в window.__pageHelpers одним скриптом,
+    # дальше вызываются короткой командой по имени (браузер не разбирает тело заново).
+    # Только для скриптов, которые страница вызывает многократно: первый вызов стоит
+    # трёх запросов (проверка, установка, вызов), разовые скрипты — через execute_script.
+    HELPERS = {}
+
     def __init__(self, driver):
         self.driver = driver
         self.wait = WebDriverWait(self.driver, 10)
+        # Заранее настроенные ожидания: создаются один раз на страницу
+        self._wait_short = WebDriverWait(self.driver, SHORT_TIMEOUT, poll_frequency=SHORT_POLL)
+        self._wait_long = WebDriverWait(self.driver, LONG_TIMEOUT, poll_frequency=LONG_POLL)
+        # Ожидание загрузки страницы: частый опрос, перерисовка DOM не считается ошибкой
+        self._wait_load = WebDriverWait(
+            self.driver, LOAD_TIMEOUT, poll_frequency=LOAD_POLL,
+            ignored_exceptions=(StaleElementReferenceException,)
+        )
 
     def find_element(self, by, value):
         return self.wait.until(EC.presence_of_element_located((by, value)))
@@ -21,9 +96,71 @@ class BasePage:
         element.clear()
         element.send_keys(text)
 
+    def call_helper(self, name, *args):
+        """
+        Вызывает JS-помощник из HELPERS по имени.
+        Если помощников ещё нет в window (первый вызов или страница перезагружена) —
+        устанавливает их одним скриптом и повторяет вызов.
+        """
+        script = _HELPER_CALL.format(name=name)
+        found, result = self._run_helper(script, args)
+        if not found:
+            self.driver.execute_script(self._helpers_install_script())
+            found, result = self._run_helper(script, args)
+            if not found:
+                raise JavascriptException(f"JS-помощник '{name}' не установлен")
+        return result
+
+    def _run_helper(self, script, args):
+        response = self.driver.execute_script(script, *args) or [False, None]
+        return response[0], response[1] if len(response) > 1 else None
+
+    @classmethod
+    def _helpers_install_script(cls) -> str:
+        script = cls.__dict__.get("_install_script")
+        if script is None:
+            body = ",\n".join(f"{name}: {source}" for name, source in cls.HELPERS.items())
+            script = f"window.__pageHelpers = Object.assign(window.__pageHelpers || {{}}, {{\n{body}\n}});"
+            cls._install_script = script
+        return script
+
+    def scroll_into_view(self, element):
+        """Прокручивает страницу к элементу (по центру экрана)."""
+        self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
+
+    def is_document_ready(self, locator) -> bool:
+        """
+        Быстрая проверка без ожидания: документ загружен и элемент уже есть в DOM.
+        """
+        try:
+            return (
+                self.driver.execute_script("return document.readyState") == "complete"
+                and bool(self.driver.find_elements(*locator))
+            )
+        except JavascriptException:
+            return False
+
+    def find_by_text(self, locator, text, exact=True):
+        """
+        Ищет видимый элемент по тексту. Поиск, сравнение текста и проверка видимости
+        выполняются в браузере одним вызовом execute_script.
+        Подходит как условие для wait.until (возвращает False, если не найден).
+
+        Args:
+            locator (tuple): (By.XPATH | By.CSS_SELECTOR | By.CLASS_NAME | By.ID | By.TAG_NAME, значение)
+            text (str): Текст элемента (пробелы внутри схлопываются)
+            exact (bool): True — текст совпадает целиком, False — содержит text
+        """
+        by, value = locator
+        if by != By.XPATH:
+            if by not in _CSS_PREFIXES:
+                raise ValueError(f"find_by_text: неподдерживаемый тип локатора '{by}'")
+            by, value = By.CSS_SELECTOR, _CSS_PREFIXES[by] + value
+        return self.driver.execute_script(_FIND_BY_TEXT_JS, by, value, text, exact) or False
+
     def is_element_visible(self, by, value):
         try:
             self.wait.until(EC.visibility_of_element_located((by, value)))
             return True
-        except:
+        except LOOKUP_ERRORS:
             return False
\ No newline at end of file
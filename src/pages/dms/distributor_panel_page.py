@@ -1,17 +1,14 @@
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from src.pages.base_page import BasePage, LOOKUP_ERRORS
 
 
-class DistributorPanelPage:
+class DistributorPanelPage(BasePage):
     def __init__(self, driver):
-        self.driver = driver
+        super().__init__(driver)
 
-        # Локаторы для пунктов меню (по тексту)
-        self.menu_item_locator_template = (
-            By.XPATH,
-            "//div[@class='sections-list__item-name text' and normalize-space()='{text}']/ancestor::li"
-        )
+        # Названия пунктов меню (нужный выбирается по тексту, см. BasePage.find_by_text)
+        self.menu_item_name_locator = (By.CSS_SELECTOR, ".sections-list__item-name")
 
         # Словарь для быстрого доступа
         self.menu_items = {
@@ -26,14 +23,26 @@ class DistributorPanelPage:
             "notifications": "Уведомления",
         }
 
+        # Готовые условия ожидания для каждого раздела (собираются один раз)
+        self._section_conditions = {
+            key: self._menu_item_condition(text)
+            for key, text in self.menu_items.items()
+        }
+
+    def _menu_item_condition(self, section_text: str):
+        """Условие для wait.until: пункт меню с указанным текстом найден."""
+        return lambda d: self.find_by_text(self.menu_item_name_locator, section_text)
+
     def is_loaded(self):
         """Проверяет, загрузилась ли панель дистрибьютора (есть хотя бы одно меню)."""
+        if self.is_document_ready((By.CLASS_NAME, "side-menu__sections-list")):
+            return True
         try:
-            WebDriverWait(self.driver, 15).until(
+            self._wait_load.until(
                 EC.presence_of_element_located((By.CLASS_NAME, "side-menu__sections-list"))
             )
             return True
-        except:
+        except LOOKUP_ERRORS:
             return False
 
     def go_to_section(self, section_key: str):
@@ -41,23 +50,17 @@ class DistributorPanelPage:
         Переходит в указанный раздел.
         :param section_key: ключ из menu_items, например 'documents', 'orders', 'warehouses'
         """
-        if section_key not in self.menu_items:
+        condition = self._section_conditions.get(section_key)
+        if condition is None:
             raise ValueError(f"Неизвестный раздел: {section_key}. Доступные: {list(self.menu_items.keys())}")
 
         section_text = self.menu_items[section_key]
 
-        # Формируем локатор по тексту
-        locator = (
-            By.XPATH,
-            f"//div[@class='sections-list__item-name text' and normalize-space()='{section_text}']/ancestor::li"
-        )
-
-        # Ждём и кликаем
+        # Ждём пункт меню с нужным текстом и кликаем по его <li>
         try:
-            item = WebDriverWait(self.driver, 20).until(
-                EC.element_to_be_clickable(locator)
-            )
-            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", item)
+            name = self._wait_long.until(condition)
+            item = name.find_element(By.XPATH, "./ancestor::li")
+            self.scroll_into_view(item)
             item.click()
             return self
         except Exception as e:
@@ -1,24 +1,87 @@
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
 from selenium.webdriver import Keys
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from src.pages.base_page import BasePage, SHORT_TIMEOUT, LOAD_POLL, LOOKUP_ERRORS, retry_stale
 import re
 
 
-class InvoicesPage:
+# Ожидание загрузки таблицы накладных (сек): таблица грузится дольше обычных страниц
+_TABLE_LOAD_TIMEOUT = 30
+
+# Формат номера накладной: XX/XXXXXX или Ч-XXXXXX
+_INVOICE_RE = re.compile(r"^(\d{2}/\d{6}|Ч-\d{6})$")
+
+# Ожидание снятия класса загрузки с таблицы: MutationObserver вызывает callback сразу,
+# без опроса со стороны Python (для execute_async_script)
+_WAIT_NOT_LOADING_JS = """
+const cb = arguments[arguments.length - 1];
+const t = document.querySelector('gui-table.invoice-list');
+if (!t) return cb(false);
+if (!t.classList.contains('invoice-list--loading')) return cb(true);
+const mo = new MutationObserver(() => {
+  if (!t.classList.contains('invoice-list--loading')) { mo.disconnect(); cb(true); }
+});
+mo.observe(t, {attributes: true, attributeFilter: ['class']});
+"""
+
+# JS-помощники страницы (устанавливаются в window один раз, см. BasePage.call_helper)
+_INVOICES_HELPERS = {
+    # Сериализация таблицы: одна команда вместо find_element + .text на каждую ячейку
+    "readTable": """() => Array.from(document.querySelectorAll('.gui-table-body tr')).map(r => {
+  const o = {};
+  r.querySelectorAll('td[gui-col-name]').forEach(
+    c => o[c.getAttribute('gui-col-name')] = c.textContent.trim().replace(/\\u00A0/g, ' ')
+  );
+  return o;
+})""",
+    # Номера накладных из всех строк таблицы
+    "readNumbers": """() => Array.from(
+  document.querySelectorAll('.gui-table-body [gui-col-name="invoiceNumber"]')
+).map(e => e.textContent.trim().replace(/\\u00A0/g, ' '))""",
+    # Строки tbody, в которых есть хотя бы одна ячейка
+    "nonEmptyRows": """tbody => Array.from(tbody.querySelectorAll('tr'))
+  .filter(r => r.querySelector('td') !== null)""",
+    # Установка значения поля через нативный setter (его видят Angular/React) + событие input
+    "setInputValue": """(el, value) => {
+  el.focus();
+  Object.getOwnPropertyDescriptor(window.HTMLInputElement.prototype, 'value').set.call(el, value);
+  el.dispatchEvent(new Event('input', {bubbles: true}));
+}""",
+}
+
+class InvoicesPage(BasePage):
+    HELPERS = {**BasePage.HELPERS, **_INVOICES_HELPERS}
+
     def __init__(self, driver):
-        self.driver = driver
+        super().__init__(driver)
+        # Ожидание загрузки таблицы: частый опрос, но прежний запас по времени
+        self._wait_table = WebDriverWait(
+            self.driver, _TABLE_LOAD_TIMEOUT, poll_frequency=LOAD_POLL,
+            ignored_exceptions=(StaleElementReferenceException,)
+        )
+        # Ожидание для смены площадки: частый опрос, перерисовка поля не считается ошибкой
+        self._wait_orgstructure = WebDriverWait(
+            self.driver, 15, poll_frequency=0.1,
+            ignored_exceptions=(NoSuchElementException, StaleElementReferenceException)
+        )
 
         # 🔹 Поле поиска
         self.search_input_locator = (
-            By.XPATH,
-            "//input[@placeholder='Поиск' and contains(@class, 'gui-input-field-element')]"
+            By.CSS_SELECTOR,
+            "input.gui-input-field-element[placeholder='Поиск']"
         )
 
         # 🔹 Выбор площадки (оргструктура)
         self.orgstructure_input_locator = (
-            By.XPATH,
-            "//input[contains(@class, 'gui-select__input') and @title]"
+            By.CSS_SELECTOR,
+            "input.gui-select__input[title]"
         )
 
         # 🔹 Список опций (выпадающий список)
@@ -62,8 +125,12 @@ class InvoicesPage:
 
     def is_loaded(self):
         """Ждёт появления таблицы и завершения загрузки."""
-        wait = WebDriverWait(self.driver, 30)
+        # Быстрый путь: страница уже загружена и таблица не в состоянии загрузки
+        if (self.is_document_ready((By.CLASS_NAME, "invoice-list"))
+                and not self.driver.find_elements(*self.loading_table_locator)):
+            return True
 
+        wait = self._wait_table
         try:
             # Сначала ждём появления самой таблицы
             wait.until(
@@ -74,31 +141,24 @@ class InvoicesPage:
                 EC.presence_of_element_located(self.loading_table_locator)
             )
             return True
-        except:
+        except LOOKUP_ERRORS:
             return False
 
     def wait_for_search_result(self):
-        wait = WebDriverWait(self.driver, 3)
+        wait = self._wait_short
 
-        # Запоминаем старый tbody (если есть)
-        try:
-            old_tbody = self.driver.find_element(*self.table_body_locator)
-        except:
-            old_tbody = None
+        # Запоминаем старый tbody (если есть; find_elements не бросает исключение)
+        tbodies = self.driver.find_elements(*self.table_body_locator)
+        old_tbody = tbodies[0] if tbodies else None
 
-        # Ждём исчезновения загрузки
-        try:
-            wait.until_not(
-                EC.presence_of_element_located(self.loading_table_locator)
-            )
-        except:
-            pass
+        # Ждём исчезновения загрузки (событие в браузере, один запрос)
+        self._wait_not_loading()
 
         # Если был старый tbody — ждём, что он исчез
         if old_tbody:
             try:
                 wait.until(EC.staleness_of(old_tbody))
-            except:
+            except TimeoutException:
                 pass
 
         # Финальная проверка результата
@@ -108,29 +168,60 @@ class InvoicesPage:
         )
         return self
     
-    def is_invoice_found(self, expected_number: str) -> bool:
+    def _wait_not_loading(self):
+        """
+        Ждёт в браузере, пока таблица выйдет из состояния загрузки (execute_async_script).
+
+        Примечание:
+        - Таймаут скриптов сессии меняется на SHORT_TIMEOUT только на время ожидания
+          и затем возвращается прежний — другие страницы его не замечают.
+        - Таймаут или ошибка JS не считаются сбоем: результат проверяется обычным ожиданием.
+        """
+        previous = self.driver.timeouts.script
+        self.driver.set_script_timeout(SHORT_TIMEOUT)
+        try:
+            self.driver.execute_async_script(_WAIT_NOT_LOADING_JS)
+        except WebDriverException:
+            pass
+        finally:
+            self.driver.set_script_timeout(previous)
+
+    def is_invoice_found(self, expected_number: str, snapshot=None) -> bool:
         """
         Проверяет, что в таблице есть накладная с точным номером.
+
+        Args:
+            expected_number (str): Номер накладной
+            snapshot (set, optional): Результат snapshot_numbers() для текущего
+                состояния таблицы — чтобы проверять много номеров без обращений к браузеру
+        """
+        if snapshot is None:
+            snapshot = self.snapshot_numbers()
+        return expected_number in snapshot
+
+    def snapshot_numbers(self) -> set:
         """
-        rows = self.get_rows()
-        for row in rows:
-            data = self.get_invoice_data(row)
-            invoice_number = data.get("number", "").strip()
-            if invoice_number == expected_number:
-                return True
-        return False
+        Возвращает множество номеров накладных в таблице (один execute_script).
+        Снимок действителен до следующего поиска/смены площадки.
+
+        Raises:
+            JavascriptException: Скрипт чтения не выполнился — пустой снимок
+                выглядел бы как «накладная не найдена», поэтому ошибка не глушится
+                (InvoiceSearchOperation.check_invoice помечает накладную как ERROR).
+        """
+        return set(self.call_helper("readNumbers") or ())
 
     def element_exists(self, element):
         """Проверяет, всё ли ещё существует элемент."""
         try:
             element.is_displayed()
             return True
-        except:
+        except (StaleElementReferenceException, NoSuchElementException):
             return False
 
     def perform_search(self, query: str):
         """Очищает и вводит текст в поле поиска."""
-        search_input = WebDriverWait(self.driver, 20).until(
+        search_input = self._wait_long.until(
             EC.visibility_of_element_located(self.search_input_locator)
         )
         search_input.click()
@@ -141,10 +232,14 @@ class InvoicesPage:
 
     def get_current_orgstructure(self):
         """Возвращает текущую выбранную площадку (из title)."""
+        def read_title():
+            # Поле ищется заново от корня документа на каждой попытке
+            fields = self.driver.find_elements(*self.orgstructure_input_locator)
+            return (fields[0].get_attribute("title") or "").strip() if fields else ""
+
         try:
-            input_field = self.driver.find_element(*self.orgstructure_input_locator)
-            return input_field.get_attribute("title").strip()
-        except:
+            return retry_stale(read_title)
+        except StaleElementReferenceException:
             return ""
 
     def wait_for_default_orgstructure_loaded(self, region: str, timeout=30):
@@ -160,25 +255,32 @@ class InvoicesPage:
         )
         return self
 
-    def select_orgstructure_by_city(self, city: str):
+    def select_orgstructure_by_city(self, city: str, use_keyboard: bool = False):
         """
         Меняет площадку, вводя название в поле и нажимая Enter.
         Пример: select_orgstructure_by_city("Новосибирск")
+
+        Args:
+            city (str): Город площадки
+            use_keyboard (bool): True — очищать и вводить текст клавиатурой (send_keys),
+                если компоненту нужны события на каждое нажатие.
+                По умолчанию значение ставится одним execute_script + событие input.
         """
         expected_text = f"ООО «Континент» ({city})"
 
-        # 1. Находим поле ввода
-        input_field = WebDriverWait(self.driver, 15).until(
-            EC.element_to_be_clickable(self.orgstructure_input_locator)
-        )
+        wait = self._wait_orgstructure
 
-        # 2. Очищаем поле (на всякий случай)
-        input_field.click()  # Кликаем, чтобы активировать
-        input_field.send_keys(Keys.CONTROL + "a")  # Выделяем всё
-        input_field.send_keys(Keys.DELETE)  # Удаляем
+        # 1. Находим поле ввода (видимое и доступное)
+        input_field = wait.until(EC.element_to_be_clickable(self.orgstructure_input_locator))
 
-        # 3. Вводим название площадки
-        input_field.send_keys(expected_text)
+        # 2-3. Очищаем поле и вводим название площадки
+        if use_keyboard:
+            input_field.click()  # Кликаем, чтобы активировать
+            input_field.send_keys(Keys.CONTROL + "a")  # Выделяем всё
+            input_field.send_keys(Keys.DELETE)  # Удаляем
+            input_field.send_keys(expected_text)
+        else:
+            self.call_helper("setInputValue", input_field, expected_text)
         print(f"⌨️ Введено в поле выбора: {expected_text}")
 
         # 4. Нажимаем Enter
@@ -186,9 +288,7 @@ class InvoicesPage:
         print("✅ Нажато Enter — выбор подтверждён")
 
         # 5. Ждём, что значение установилось
-        WebDriverWait(self.driver, 15).until(
-            lambda d: city in self.get_current_orgstructure()
-        )
+        wait.until(lambda d: city in self.get_current_orgstructure())
         print(f"✅ Текущая площадка: {self.get_current_orgstructure()}")
 
         return self
@@ -199,15 +299,12 @@ class InvoicesPage:
         """
         try:
             # Явно перезапрашиваем tbody и строки
-            tbody = WebDriverWait(self.driver, 10).until(
+            tbody = self.wait.until(
                 EC.presence_of_element_located(self.table_body_locator)
             )
-            rows = tbody.find_elements(*self.table_row_locator)
-            return [
-                row for row in rows
-                if len(row.find_elements(By.TAG_NAME, "td")) > 0
-            ]
-        except:
+            # Непустые строки отбираются в браузере одной командой
+            return self.call_helper("nonEmptyRows", tbody) or []
+        except WebDriverException:
             return []
 
     def get_invoice_data(self, row):
@@ -229,24 +326,40 @@ class InvoicesPage:
 
     def get_all_invoices(self):
         """Возвращает список всех накладных (в виде словарей)."""
-        rows = self.get_rows()
+        return self.get_all_invoices_fast()
+
+    def get_all_invoices_fast(self):
+        """
+        Читает всю таблицу одним execute_script и возвращает список словарей
+        с ключами self.columns (как get_invoice_data).
+
+        Примечание:
+        - Строки без какой-либо из колонок или без номера пропускаются.
+
+        Raises:
+            JavascriptException: Скрипт чтения не выполнился — не выдаётся за пустую таблицу.
+        """
+        raw_rows = self.call_helper("readTable") or []
+
+        columns = self.columns.items()
         invoices = []
-        for row in rows:
-            data = self.get_invoice_data(row)
-            if data.get("number"):  # если номер есть
+        for raw in raw_rows:
+            try:
+                data = {col_key: raw[col_name] for col_key, col_name in columns}
+            except KeyError:
+                continue
+            if data["number"]:  # если номер есть
                 invoices.append(data)
         return invoices
 
     def is_empty(self):
         """Проверяет, отображается ли сообщение 'Нет данных'."""
+        # find_elements не бросает исключение, если сообщения нет (частый случай)
         try:
-            message = self.driver.find_element(*self.empty_message_locator)
-            return message.is_displayed()
-        except:
+            return any(e.is_displayed() for e in self.driver.find_elements(*self.empty_message_locator))
+        except StaleElementReferenceException:
             return False
 
     def is_valid_invoice_number(self, number: str) -> bool:
         """Проверяет формат номера: XX/XXXXXX или Ч-XXXXXX."""
-        number = number.strip()
-        pattern = r"^(\d{2}/\d{6}|Ч-\d{6})$"
-        return bool(re.match(pattern, number))
\ No newline at end of file
+        return _INVOICE_RE.match(number.strip()) is not None
\ No newline at end of file
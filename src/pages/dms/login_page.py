@@ -1,27 +1,30 @@
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from src.pages.base_page import BasePage, LOOKUP_ERRORS
 
-class LoginPage:
+
+class LoginPage(BasePage):
     def __init__(self, driver):
-        self.driver = driver
+        super().__init__(driver)
         self.login_field_locator = (By.ID, "login")
         self.password_field_locator = (By.ID, "password")
         self.submit_button_locator = (By.ID, "submitButton")
 
     def is_loaded(self):
         """Проверяет, загружена ли страница входа."""
+        if self.is_document_ready(self.login_field_locator):
+            return True
         try:
-            WebDriverWait(self.driver, 15).until(
+            self._wait_load.until(
                 EC.presence_of_element_located(self.login_field_locator)
             )
             return True
-        except:
+        except LOOKUP_ERRORS:
             return False
 
     def login(self, username: str, password: str):
         """Выполняет ввод логина, пароля и нажатие кнопки 'Войти'."""
-        login_field = WebDriverWait(self.driver, 15).until(
+        login_field = self._wait_long.until(
             EC.presence_of_element_located(self.login_field_locator)
         )
         login_field.clear()
@@ -34,4 +37,4 @@ class LoginPage:
         submit_button = self.driver.find_element(*self.submit_button_locator)
         submit_button.click()
 
-        return self
\ No newline at end of file
+        return self
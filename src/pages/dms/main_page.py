@@ -1,17 +1,24 @@
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from src.pages.base_page import BasePage
 
-class MainPage:
+class MainPage(BasePage):
     def __init__(self, driver):
-        self.driver = driver
+        super().__init__(driver)
         self.url = "https://goodfood.shop"
 
-        # Модалка: "Да, верно"
+        # Модалка: "Да, верно" (кнопка выбирается по тексту, см. BasePage.find_by_text)
         self.region_popup_button_locator = (
-            By.XPATH,
-            "//button[@buttontype='primary' and contains(@class, 'primary')]"
-            "[.//div[contains(text(), 'Да, верно')]]"
+            By.CSS_SELECTOR,
+            "button[buttontype='primary'].primary"
+        )
+        self.region_popup_button_text = "Да, верно"
+        # Модалка часто не появляется — ждём её недолго и с частым опросом
+        self._wait_popup = WebDriverWait(
+            self.driver, 2, poll_frequency=0.1,
+            ignored_exceptions=(NoSuchElementException,)
         )
 
         # Кнопка "Войти" на главной
@@ -28,12 +35,16 @@ class MainPage:
     def accept_region_popup(self):
         """Закрывает модальное окно с подтверждением региона (если появилось)."""
         try:
-            button = WebDriverWait(self.driver, 20).until(
-                EC.element_to_be_clickable(self.region_popup_button_locator)
+            button = self._wait_popup.until(
+                lambda d: self.find_by_text(
+                    self.region_popup_button_locator, self.region_popup_button_text, exact=False
+                )
             )
-            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", button)
+            self.scroll_into_view(button)
             button.click()
             print("✅ Модальное окно 'Да, верно' закрыто.")
+        except TimeoutException:
+            print("ℹ️ Модальное окно не появилось.")
         except Exception as e:
             print(f"ℹ️ Модальное окно не появилось или уже закрыто: {e}")
         return self
@@ -41,12 +52,12 @@ class MainPage:
     def go_to_login_page(self):
         """Переходит на страницу входа через кнопку 'Войти'."""
         # Ждём, пока лоадер исчезнет
-        WebDriverWait(self.driver, 15).until(
+        self._wait_long.until(
             EC.invisibility_of_element_located((By.CLASS_NAME, "main-page--loading"))
         )
-        button = WebDriverWait(self.driver, 20).until(
+        button = self._wait_long.until(
             EC.element_to_be_clickable(self.login_button_locator)
         )
-        self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", button)
+        self.scroll_into_view(button)
         button.click()
         return self
\ No newline at end of file
@@ -1,11 +1,11 @@
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from src.pages.base_page import BasePage, LOOKUP_ERRORS
 
 
-class SubsystemsPage:
+class SubsystemsPage(BasePage):
     def __init__(self, driver):
-        self.driver = driver
+        super().__init__(driver)
         # 🔹 Локатор по тексту внутри карточки
         self.distributor_panel_card_locator = (
             By.XPATH,
@@ -14,20 +14,22 @@ class SubsystemsPage:
 
     def is_loaded(self):
         """Проверяет, загрузилась ли страница подсистем (хотя бы одна карточка есть)."""
+        if self.is_document_ready((By.TAG_NAME, "nes-subsystem-card")):
+            return True
         try:
-            WebDriverWait(self.driver, 15).until(
+            self._wait_load.until(
                 EC.presence_of_element_located((By.TAG_NAME, "nes-subsystem-card"))
             )
             return True
-        except:
+        except LOOKUP_ERRORS:
             return False
 
     def go_to_distributor_panel(self):
         """Кликает по карточке 'Панель дистрибьютора'."""
-        card_link = WebDriverWait(self.driver, 20).until(
+        card_link = self._wait_long.until(
             EC.element_to_be_clickable(self.distributor_panel_card_locator)
         )
         # Прокрутка к элементу (карточки могут быть ниже)
-        self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", card_link)
+        self.scroll_into_view(card_link)
         card_link.click()
         return self
\ No newline at end of file
@@ -7,13 +7,32 @@
 В будущем будет полноценным оркестратором для функций обработки и чтения файлов разных форматов.
 """
 import os
-from typing import List, Dict
+from pathlib import Path
+from typing import List, Dict, Iterator, Optional
 import pandas as pd
 from openpyxl import load_workbook
 
 from src.core.logger import Logger
 
 
+# python-calamine (Rust) читает xlsx в разы быстрее openpyxl — если установлен; иначе openpyxl.
+try:
+    import python_calamine  # noqa: F401
+    _EXCEL_ENGINE = "calamine"
+except ImportError:
+    _EXCEL_ENGINE = "openpyxl"
+
+
+# Столбцы исходного файла → ключи записей о накладных
+INVOICE_COLUMNS = {
+    "Названия строк": "number",
+    "ID XCRM Parent": "crm_id",
+    "Address Normalized": "address",
+    "ISA": "isa_amount",
+    "SFA": "sfa_amount",
+}
+
+
 class FileHandler:
     """
     Обработчик Excel-файла.
@@ -23,7 +42,8 @@ class FileHandler:
     def __init__(self, file_path: str, logger: Logger):
         self.file_path = file_path
         self.logger = logger
-        self.full_path = os.path.join(os.getcwd(), file_path)
+        # Канонический абсолютный путь вычисляется один раз — не зависит от смены рабочей папки
+        self.full_path = str(Path(file_path).resolve())
 
     def read_invoices(self, sheet_name: str) -> List[Dict]:
         """
@@ -37,30 +57,34 @@ class FileHandler:
         Returns:
             List[Dict]: Список строк в виде словарей.
         """
-        if not os.path.exists(self.full_path):
+        if not os.path.isfile(self.full_path):
             raise FileNotFoundError(f"Файл не найден: {self.full_path}")
 
         try:
-            # Пропускаем первые 10 строк (0-индексация: строки 0–9), 10-я — заголовки (индекс 10)
-            df = pd.read_excel(self.full_path, sheet_name=sheet_name, skiprows=10, header=0, dtype=str)
+            # Пропускаем первые 10 строк (0-индексация: строки 0–9), 10-я — заголовки (индекс 10).
+            # Читаем только нужные столбцы (callable не падает, если столбца нет — это проверяем ниже)
+            expected_columns = INVOICE_COLUMNS.keys()
+            df = pd.read_excel(
+                self.full_path, sheet_name=sheet_name, skiprows=10, header=0, dtype=str,
+                usecols=expected_columns.__contains__, engine=_EXCEL_ENGINE,
+            )
 
             # Убедимся, что у нас есть нужные столбцы
-            expected_columns = {"Названия строк", "ID XCRM Parent", "Address Normalized", "ISA", "SFA"}
-            missing = expected_columns - set(df.columns)
-            if missing:
+            columns = set(df.columns)
+            if not expected_columns <= columns:
+                missing = expected_columns - columns
                 raise ValueError(f"Отсутствуют обязательные столбцы: {missing}")
 
-            # Переименовываем только нужные столбцы
-            data = df.rename(columns={
-                "Названия строк": "number",
-                "ID XCRM Parent": "crm_id",
-                "Address Normalized": "address",
-                "ISA": "isa_amount",
-                "SFA": "sfa_amount",
-            })
+            # Пустой лист (только заголовки) — конвертировать нечего
+            if df.empty:
+                return []
 
-            # Оставляем только нужные колонки
-            data = data[["number", "crm_id", "address", "isa_amount", "sfa_amount"]]
+            # Переименовываем и оставляем только нужные столбцы
+            data = df.rename(columns=INVOICE_COLUMNS)[list(INVOICE_COLUMNS.values())]
+            if _EXCEL_ENGINE == "calamine":
+                # calamine отдаёт типизированные значения и не везде учитывает dtype=str —
+                # приводим к строкам только пять оставленных столбцов
+                data = data.astype("string")
 
             # Конвертируем в список словарей
             records = data.to_dict(orient="records")
@@ -88,6 +112,68 @@ class FileHandler:
             # Все остальные ошибки (включая ошибки pandas) — оборачиваем в RuntimeError
             raise RuntimeError(f"Ошибка при чтении Excel-файла: {e}")
 
+    def iter_invoices(self, sheet_name: str) -> Iterator[Dict[str, Optional[str]]]:
+        """
+        Потоковый вариант read_invoices: читает лист через openpyxl (read_only)
+        и отдаёт записи по одной, не загружая весь лист в память.
+
+        Шаги:
+        1. Открыть книгу в режиме read_only + data_only
+        2. Прочитать заголовки из 11-й строки и один раз найти индексы нужных столбцов
+        3. Для каждой строки данных собрать словарь из пяти полей
+
+        Примечание:
+        - Формат записей и ошибки совпадают с read_invoices:
+          значения — строки без пробелов по краям, пустые → None;
+          целые числа в ячейках (12345.0) → "12345", как у pandas.
+        - Пустые строки в конце листа (в т.ч. только с оформлением) отбрасываются,
+          пустые строки между данными — остаются, как у read_invoices.
+
+        Yields:
+            Dict: Запись о накладной.
+        """
+        if not os.path.isfile(self.full_path):
+            raise FileNotFoundError(f"Файл не найден: {self.full_path}")
+
+        wb = load_workbook(self.full_path, read_only=True, data_only=True)
+        try:
+            if sheet_name not in wb.sheetnames:
+                raise ValueError(f"Лист '{sheet_name}' не найден в файле '{self.full_path}'. Проверьте название листа.")
+
+            # Строки 1–10 пропускаем, 11-я — заголовки
+            rows = wb[sheet_name].iter_rows(min_row=11, values_only=True)
+            header = next(rows, ())
+            positions = {
+                name: index for index, name in enumerate(header)
+                if name in INVOICE_COLUMNS
+            }
+            if not INVOICE_COLUMNS.keys() <= positions.keys():
+                missing = INVOICE_COLUMNS.keys() - positions.keys()
+                raise ValueError(f"Отсутствуют обязательные столбцы: {missing}")
+
+            fields = [(key, positions[name]) for name, key in INVOICE_COLUMNS.items()]
+            # Пустые строки придерживаем: отдаём, только если после них есть данные
+            pending_empty = 0
+            for row in rows:
+                if all(value is None or value == "" for value in row):
+                    pending_empty += 1
+                    continue
+                for _ in range(pending_empty):
+                    yield dict.fromkeys(INVOICE_COLUMNS.values())
+                pending_empty = 0
+
+                record = {}
+                for key, index in fields:
+                    value = row[index] if index < len(row) else None
+                    if value is not None:
+                        if isinstance(value, float) and value.is_integer():
+                            value = int(value)
+                        value = str(value).strip() or None
+                    record[key] = value
+                yield record
+        finally:
+            wb.close()
+
     def read_existing_report(self, file_path: str) -> List[Dict]:
         """
         Читает существующий отчёт и возвращает список данных о НЕ найденных накладных.
@@ -113,7 +199,7 @@ class FileHandler:
             List[Dict]: Только накладные со статусом not_found
         """
         try:
-            wb = load_workbook(file_path, read_only=True)
+            wb = load_workbook(file_path, read_only=True, data_only=True, keep_links=False)
             if "Полный отчёт" not in wb.sheetnames:
                 self.logger.error("❌ В отчёте нет листа 'Полный отчёт'")
                 return []
@@ -121,25 +207,27 @@ class FileHandler:
             ws = wb["Полный отчёт"]
             records = []
 
-            # === Поиск заголовков ===
-            headers = {}
-            header_row = None
-            for row in ws.iter_rows(min_row=1, max_row=20):
-                for cell in row:
-                    if cell.value and str(cell.value).strip() == "Номер":
-                        header_row = row[0].row
-                        break
-                if header_row:
+            # Один проход по листу: значения ячеек без объектов Cell (values_only)
+            rows = ws.iter_rows(values_only=True)
+
+            # === Поиск заголовков (в первых 20 строках) ===
+            header = None
+            for row_number, row in enumerate(rows, start=1):
+                if any(value and str(value).strip() == "Номер" for value in row):
+                    header = row
+                    break
+                if row_number >= 20:
                     break
 
-            if not header_row:
+            if header is None:
                 self.logger.error("❌ Не найдены заголовки в отчёте")
                 return []
 
             # === Определяем индексы колонок ===
-            for cell in ws[header_row]:
-                if cell.value:
-                    headers[str(cell.value).strip().lower()] = cell.column - 1
+            headers = {
+                str(value).strip().lower(): index
+                for index, value in enumerate(header) if value
+            }
 
             required = {"номер", "crm id", "адрес", "isa", "sfa", "город", "префикс", "регион", "статус"}
             if not required.issubset(headers.keys()):
@@ -147,26 +235,34 @@ class FileHandler:
                 self.logger.error(f"❌ Отсутствуют колонки: {missing}")
                 return []
 
-            # === Читаем данные ===
-            for row in ws.iter_rows(min_row=header_row + 1):
-                if not row[headers["номер"]].value:
+            i_number, i_status = headers["номер"], headers["статус"]
+            i_crm_id, i_address = headers["crm id"], headers["адрес"]
+            i_isa, i_sfa = headers["isa"], headers["sfa"]
+            i_city, i_prefix, i_region = headers["город"], headers["префикс"], headers["регион"]
+
+            def text(value):
+                return str(value).strip() if value else None
+
+            # === Читаем данные (тот же итератор — строки после заголовков) ===
+            for row in rows:
+                number = row[i_number]
+                if not number:
                     continue
 
-                status = str(row[headers["статус"]].value).strip().lower()
-                if status != "not_found":
+                if str(row[i_status]).strip().lower() != "not_found":
                     continue  # пропускаем найденные
 
-                record = {
-                    "number": str(row[headers["номер"]].value).strip(),
-                    "crm_id": str(row[headers["crm id"]].value).strip() if row[headers["crm id"]].value else None,
-                    "address": str(row[headers["адрес"]].value).strip() if row[headers["адрес"]].value else None,
-                    "isa_amount": float(row[headers["isa"]].value) if row[headers["isa"]].value else None,
-                    "sfa_amount": float(row[headers["sfa"]].value) if row[headers["sfa"]].value else None,
-                    "delivery_city": str(row[headers["город"]].value).strip() if row[headers["город"]].value else None,
-                    "prefix": str(row[headers["префикс"]].value).strip() if row[headers["префикс"]].value else None,
-                    "region": str(row[headers["регион"]].value).strip() if row[headers["регион"]].value else None,
-                }
-                records.append(record)
+                isa, sfa = row[i_isa], row[i_sfa]
+                records.append({
+                    "number": str(number).strip(),
+                    "crm_id": text(row[i_crm_id]),
+                    "address": text(row[i_address]),
+                    "isa_amount": float(isa) if isa else None,
+                    "sfa_amount": float(sfa) if sfa else None,
+                    "delivery_city": text(row[i_city]),
+                    "prefix": text(row[i_prefix]),
+                    "region": text(row[i_region]),
+                })
 
             self.logger.info(f"✅ Прочитано {len(records)} накладных из отчёта для обновления")
             return records
@@ -34,12 +34,28 @@ from PyQt5.QtWidgets import (
     QPushButton,
     QFrame, QLineEdit
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, pyqtSlot
 from PyQt5.QtGui import QFont
 
 # --- Локальные импорты ---
 from src.core.config import Config
 from src.core.logger import Logger
+from src.ui.styles import NAV_BUTTON_QSS
+
+
+# === Стили (QSS) кнопок вкладки; общие стили — в src/ui/styles.py ===
+_SAVE_BTN_QSS = """
+QPushButton {
+    background-color: #4CAF50;
+    color: white;
+    padding: 10px;
+    border-radius: 5px;
+    font-weight: bold;
+}
+QPushButton:hover {
+    background-color: #45a049;
+}
+"""
 
 
 class SettingsAppView(QWidget):
@@ -50,6 +66,7 @@ class SettingsAppView(QWidget):
     - config (Config): объект конфигурации
     - logger (Logger): глобальный логгер
     - full_log_checkbox (QCheckBox): чекбокс для опции 'full_log'
+    - navigation_button (QPushButton): кнопка вкладки в боковом меню
     """
 
     def __init__(self, logger: Logger, config: Config):
@@ -77,6 +94,9 @@ class SettingsAppView(QWidget):
 
         self.full_log_checkbox = None
 
+        # === Кнопка навигации ===
+        self.navigation_button = self.get_navigation_button()
+
         self._setup_ui()
         self._load_settings()
         self._connect_signals()
@@ -128,18 +148,7 @@ class SettingsAppView(QWidget):
         # === Кнопка "Сохранить" ===
         save_btn = QPushButton("💾 Сохранить настройки")
         save_btn.setFixedWidth(300)
-        save_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                padding: 10px;
-                border-radius: 5px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-        """)
+        save_btn.setStyleSheet(_SAVE_BTN_QSS)
         layout.addWidget(save_btn)
         layout.addStretch()  # Растягивает вниз
 
@@ -164,6 +173,7 @@ class SettingsAppView(QWidget):
         """
         self.save_button.clicked.connect(self._on_save_clicked)
 
+    @pyqtSlot()
     def _on_save_clicked(self):
         """
         Обработчик нажатия кнопки "Сохранить".
@@ -198,32 +208,6 @@ class SettingsAppView(QWidget):
         btn = QPushButton("⚙️ Настройки")
         btn.setCheckable(True)
         btn.setToolTip("Открыть настройки приложения")
-        btn.setStyleSheet("""
-            QPushButton {
-                text-align: left;
-                padding: 12px 15px;
-                font-size: 14px;
-                font-weight: 500;
-                border: none;
-                background-color: #f0f0f0;
-                color: #202124;
-                border-radius: 8px;
-                margin: 4px 8px;
-            }
-            QPushButton:hover {
-                background-color: #e0e0e0;
-            }
-            QPushButton:checked {
-                background-color: #4285f4;
-                color: white;
-                font-weight: 600;
-            }
-            QPushButton:checked:hover {
-                background-color: #3367d6;
-            }
-            QPushButton:pressed {
-                background-color: #3367d6;
-            }
-        """)
+        btn.setStyleSheet(NAV_BUTTON_QSS)
         btn.setCursor(Qt.PointingHandCursor)
         return btn
\ No newline at end of file
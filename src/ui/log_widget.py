@@ -23,8 +23,10 @@
 Статус: Полностью готов
 """
 
+import time
+
 from PyQt5.QtWidgets import QWidget, QTextEdit, QVBoxLayout, QCheckBox, QAction, QMenu
-from PyQt5.QtCore import pyqtSignal, QObject, Qt
+from PyQt5.QtCore import pyqtSignal, pyqtSlot, QObject, Qt, QTimer
 from src.core.signals import log_signal
 
 
@@ -39,6 +41,9 @@ class LogWidget(QWidget):
         - log_signal (LogSignal): Сигнал, на который подписывается виджет.
         - log_buffer (list): Хранит все логи (даже при скрытии).
         - is_visible (bool): Флаг — виден ли виджет в данный момент.
+        - _pending (list): HTML-строки, ещё не выведенные в text_edit.
+        - _flush_timer (QTimer): Одноразовый таймер (50 мс) — выводит _pending одной вставкой.
+        - _last_ts_sec / _last_ts_str: Кэш метки времени — strftime не чаще раза в секунду.
         """
         super().__init__()
         self.text_edit = None
@@ -46,6 +51,13 @@ class LogWidget(QWidget):
         self.log_signal = log_signal
         self.log_buffer = []
         self.is_visible = False
+        self._pending = []
+        self._last_ts_sec = 0     # Секунда, для которой уже отформатировано время
+        self._last_ts_str = ""    # Кэш "%H:%M:%S" для этой секунды
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(50)
+        self._flush_timer.timeout.connect(self._flush_pending)
         self.setup_ui()
         self.connect_signals()
 
@@ -109,6 +121,7 @@ class LogWidget(QWidget):
         self.text_edit.customContextMenuRequested.connect(self.show_context_menu)
 
 
+    @pyqtSlot(str, str)
     def on_log_received(self, level: str, message: str):
         """
         Обрабатывает новое сообщение лога.
@@ -126,15 +139,19 @@ class LogWidget(QWidget):
            - ERROR: красный (#FF0000)
         3. Сформировать строку в формате HTML:
            <span style="color: #FF0000">[ERROR] 14:30:22 — Сбой авторизации</span>
-        4. Добавить строку в text_edit.
-        5. Если auto_scroll включён — прокрутить вниз.
+        4. Поставить строку в очередь _pending и запустить _flush_timer (если ещё не запущен).
+        5. _flush_pending() добавит всю очередь в text_edit и прокрутит вниз один раз.
 
         Примечание:
         - Даже если виджет скрыт — логи всё равно попадают в буфер.
         - При открытии виджета можно отобразить всю историю.
+        - Пачка логов за 50 мс выводится одной вставкой: одна перекладка QTextEdit вместо N.
         """
-        from datetime import datetime
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        now = int(time.time())
+        if now != self._last_ts_sec:
+            self._last_ts_sec = now
+            self._last_ts_str = time.strftime("%H:%M:%S", time.localtime(now))
+        timestamp = self._last_ts_str
 
         self.log_buffer.append((level, message, timestamp))
 
@@ -147,7 +164,17 @@ class LogWidget(QWidget):
         }.get(level, "#000000")
 
         log_entry = f'<span style="color:{color};">[{level}] {timestamp} — {message}</span>'
-        self.text_edit.append(log_entry)
+        self._pending.append(log_entry)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    @pyqtSlot()
+    def _flush_pending(self):
+        """Выводит накопленные строки в text_edit одной вставкой и прокручивает вниз."""
+        if not self._pending:
+            return
+        entries, self._pending = self._pending, []
+        self.text_edit.append("<br>".join(entries))
 
         if self.auto_scroll.isChecked():
             scrollbar = self.text_edit.verticalScrollBar()
@@ -202,6 +229,7 @@ class LogWidget(QWidget):
         Пример использования:
         - Пользователь нашёл ошибку → копирует лог → отправляет разработчику.
         """
+        self._flush_pending()
         self.text_edit.selectAll()
         self.text_edit.copy()
         cursor = self.text_edit.textCursor()
@@ -231,6 +259,8 @@ class LogWidget(QWidget):
             QMessageBox.No
         )
         if reply == QMessageBox.Yes:
+            self._flush_timer.stop()
+            self._pending.clear()
             self.text_edit.clear()
             self.log_buffer.clear()
 
@@ -57,8 +57,13 @@ class MainWindow(QMainWindow):
     - Получает виджеты от Application через add_tab()
     - Предоставляет методы для активации, получения и удаления вкладок
     - Поддерживает боковое меню для навигации
+
+    Сигналы:
+    - tab_switched(QWidget): испускается после каждого switch_to() с новым активным виджетом
     """
 
+    tab_switched = pyqtSignal(QWidget)
+
     def __init__(self, logger: Logger):
         """
         Инициализирует главное окно с центральным QTabWidget.
@@ -265,7 +270,7 @@ class MainWindow(QMainWindow):
         3. Добавить новый виджет в central_layout
         4. Найти navigation_button у нового виджета (если есть) и установить checked=True
         5. Снять checked со всех остальных кнопок в sidebar_layout
-        6. Залогировать смену виджета
+        6. Испустить сигнал tab_switched(widget) — для ShortcutManager и других подписчиков
 
         Примечание:
         - Это гарантирует, что только одна кнопка в боковом меню будет активной
@@ -293,7 +298,9 @@ class MainWindow(QMainWindow):
         # Устанавливаем checked на текущую кнопку
         if hasattr(widget, 'navigation_button') and widget.navigation_button:
             widget.navigation_button.setChecked(True)
-        
+
+        self.tab_switched.emit(widget)
+
     def current_widget(self):
         """Возвращает текущий активный виджет."""
         return self._current_widget
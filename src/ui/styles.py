@@ -0,0 +1,39 @@
+"""
+Модуль: styles.py
+Описание: Общие стили (QSS) виджетов приложения.
+
+Назначение:
+- Хранить стили, одинаковые для нескольких вкладок, в одном месте.
+
+Архитектурная роль:
+- Используется view-классами вкладок (например, кнопки бокового меню).
+"""
+
+# === Кнопка вкладки в боковом меню ===
+NAV_BUTTON_QSS = """
+QPushButton {
+    text-align: left;
+    padding: 12px 15px;
+    font-size: 14px;
+    font-weight: 500;
+    border: none;
+    background-color: #f0f0f0;
+    color: #202124;
+    border-radius: 8px;
+    margin: 4px 8px;
+}
+QPushButton:hover {
+    background-color: #e0e0e0;
+}
+QPushButton:checked {
+    background-color: #4285f4;
+    color: white;
+    font-weight: 600;
+}
+QPushButton:checked:hover {
+    background-color: #3367d6;
+}
+QPushButton:pressed {
+    background-color: #3367d6;
+}
+"""
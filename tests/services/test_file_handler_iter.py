@@ -0,0 +1,49 @@
+# tests/services/test_file_handler_iter.py
+from unittest.mock import MagicMock
+
+from openpyxl import Workbook
+from openpyxl.styles import PatternFill
+
+from src.services.file_handler import FileHandler
+
+
+SHEET = "Данные"
+
+
+def make_workbook(path):
+    """Лист в формате выгрузки: 10 строк фильтров, заголовки в 11-й строке, данные с 12-й."""
+    wb = Workbook()
+    ws = wb.active
+    ws.title = SHEET
+    for row in range(1, 11):
+        ws.cell(row=row, column=1, value=f"Фильтр {row}")
+    ws.append(["Названия строк", "ID XCRM Parent", "Другое", "Address Normalized", "ISA", "SFA"])
+    ws.append(["05/050426", "{A6}", "x", "  г Новосибирск ", 3106.64, None])
+    ws.append([12345, 67890.0, None, "адрес", 0, 1.5])
+    ws.append([None] * 6)  # пустая строка между данными
+    ws.append(["Ч-054192", "   ", "y", "", 100.0, True])
+    # Пустые строки в конце, только с оформлением
+    fill = PatternFill("solid", fgColor="FFFF00")
+    for row in range(ws.max_row + 1, ws.max_row + 4):
+        ws.cell(row=row, column=1).fill = fill
+    wb.save(path)
+
+
+class TestIterInvoices:
+    """Тесты потокового чтения накладных: результат совпадает с read_invoices."""
+
+    def test_iter_invoices_matches_read_invoices(self, tmp_path):
+        """TC-FH-20: iter_invoices отдаёт те же записи, что и read_invoices"""
+        path = tmp_path / "sales.xlsx"
+        make_workbook(path)
+        handler = FileHandler(str(path), MagicMock())
+
+        expected = handler.read_invoices(SHEET)
+        actual = list(handler.iter_invoices(SHEET))
+
+        assert actual == expected
+        assert actual[1] == {
+            "number": "12345", "crm_id": "67890", "address": "адрес",
+            "isa_amount": "0", "sfa_amount": "1.5",
+        }
+        assert len(actual) == 4
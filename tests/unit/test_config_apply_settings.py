@@ -0,0 +1,55 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.core.config import Config
+
+
+@pytest.fixture
+def config():
+    config = Config(MagicMock())
+    config.data = {"full_log": False, "window_size": [1200, 800], "maximized": False}
+    return config
+
+
+@pytest.fixture
+def emitted(config):
+    batches = []
+    config.settings_applied.connect(batches.append)
+    return batches
+
+
+class TestApplySettings:
+    """Unit-тесты Config.apply_settings: пакет изменений и отсев повторов (_last_emitted)."""
+
+    def test_first_apply_emits_all_settings(self, config, emitted):
+        """TC-AS-01: Первый вызов отправляет оба ключа одним сигналом"""
+        config.apply_settings()
+        assert emitted == [{
+            "full_log": False,
+            "window_mode": {"window_size": [1200, 800], "maximized": False},
+        }]
+
+    def test_repeated_apply_without_changes_emits_nothing(self, config, emitted):
+        """TC-AS-02: Повторное "Сохранить" без изменений не отправляет сигнал"""
+        config.apply_settings()
+        config.apply_settings()
+        assert len(emitted) == 1
+
+    def test_only_changed_key_is_emitted(self, config, emitted):
+        """TC-AS-03: В пакет попадает только изменившаяся настройка"""
+        config.apply_settings()
+        config.set("full_log", True)
+        config.apply_settings()
+        assert emitted[-1] == {"full_log": True}
+
+    def test_window_size_compared_by_value(self, config, emitted):
+        """TC-AS-04: Новый список с тем же размером не считается изменением, другой размер — считается"""
+        config.apply_settings()
+        config.set("window_size", [1200, 800])
+        config.apply_settings()
+        assert len(emitted) == 1
+
+        config.set("window_size", [1000, 700])
+        config.apply_settings()
+        assert emitted[-1] == {"window_mode": {"window_size": [1000, 700], "maximized": False}}
@@ -0,0 +1,64 @@
+import pytest
+from dotenv import dotenv_values
+
+from src.core.config import Config
+
+
+ENV_CONTENT = """\
+# Сибирь
+DMS_USERNAME_SIB=user123
+DMS_PASSWORD_SIB = pass456
+export DMS_USERNAME_URAL=ural_user
+export\tDMS_PASSWORD_URAL=ural_pass # комментарий
+DMS_BASE_URL="https://goodfood.shop/"
+CRM_BASE_URL='https://crm.nestle.ru/#/main'
+CRM_USERNAME=crm_user\t# комментарий после табуляции
+CRM_PASSWORD=pa#ss
+OPEN_ROUTER_API_KEY=sk-123
+UNRELATED_KEY=ignored
+"""
+
+
+@pytest.fixture
+def config(tmp_path):
+    env_path = tmp_path / ".env"
+    env_path.write_text(ENV_CONTENT, encoding="utf-8")
+    config = Config(None)
+    config.env_path = env_path
+    return config
+
+
+class TestReadEnvSecrets:
+    """Unit-тесты разбора .env в Config._read_env_secrets."""
+
+    def test_reads_only_secret_keys(self, config):
+        """TC-ENV-01: Извлекаются только ключи секретов"""
+        secrets = config._read_env_secrets()
+        assert "UNRELATED_KEY" not in secrets
+        assert secrets["DMS_USERNAME_SIB"] == "user123"
+        assert secrets["DMS_PASSWORD_SIB"] == "pass456"
+
+    def test_export_prefix(self, config):
+        """TC-ENV-02: Строки 'export KEY=value' (пробел или табуляция) не теряются"""
+        secrets = config._read_env_secrets()
+        assert secrets["DMS_USERNAME_URAL"] == "ural_user"
+        assert secrets["DMS_PASSWORD_URAL"] == "ural_pass"
+
+    def test_inline_comments_and_quotes(self, config):
+        """TC-ENV-03: Комментарий после пробела/табуляции отбрасывается, '#' в кавычках и внутри значения сохраняется"""
+        secrets = config._read_env_secrets()
+        assert secrets["CRM_USERNAME"] == "crm_user"
+        assert secrets["CRM_PASSWORD"] == "pa#ss"
+        assert secrets["DMS_BASE_URL"] == "https://goodfood.shop/"
+        assert secrets["CRM_BASE_URL"] == "https://crm.nestle.ru/#/main"
+
+    def test_matches_python_dotenv(self, config):
+        """TC-ENV-04: Результат совпадает с python-dotenv для тех же ключей"""
+        secrets = config._read_env_secrets()
+        expected = {
+            key: value.strip().strip('"\'')
+            for key, value in dotenv_values(config.env_path).items()
+            if key in secrets
+        }
+        assert secrets == expected
+        assert len(secrets) == 9
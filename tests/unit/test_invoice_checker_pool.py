@@ -0,0 +1,93 @@
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.buisness_processes.check_invoices.pool import InvoiceCheckerPool
+from src.buisness_processes.check_invoices.process import InvoiceCheckerProcess, MAX_DMS_SESSIONS
+
+
+class FakeOperation:
+    """Заменяет InvoiceSearchOperation: без браузера, запоминает сессии."""
+
+    instances = []
+    lock = threading.Lock()
+
+    def __init__(self, region, logger, config):
+        self.started = False
+        self.closed = False
+        with self.lock:
+            FakeOperation.instances.append(self)
+
+    def start(self):
+        self.started = True
+
+    def check_invoice(self, invoice):
+        assert self.started and not self.closed
+        return f"{invoice}:checked"
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def fake_operation():
+    FakeOperation.instances = []
+    with patch("src.buisness_processes.check_invoices.pool.InvoiceSearchOperation", FakeOperation):
+        yield
+
+
+class TestInvoiceCheckerPool:
+    """Unit-тесты InvoiceCheckerPool: порядок результатов и число сессий."""
+
+    @pytest.mark.parametrize("num_drivers, count", [(1, 5), (3, 10), (4, 7), (4, 2)])
+    def test_results_keep_input_order(self, num_drivers, count):
+        """TC-POOL-01: Результаты в порядке исходного списка при любом числе шардов"""
+        invoices = [f"inv{i}" for i in range(count)]
+        pool = InvoiceCheckerPool("siberia", MagicMock(), MagicMock(), num_drivers=num_drivers)
+
+        results = pool.check_invoices(invoices)
+
+        assert results == [f"inv{i}:checked" for i in range(count)]
+
+    def test_sessions_not_more_than_invoices_and_all_closed(self):
+        """TC-POOL-02: Сессий не больше, чем накладных; каждая закрывается"""
+        pool = InvoiceCheckerPool("ural", MagicMock(), MagicMock(), num_drivers=4)
+
+        pool.check_invoices(["a", "b"])
+
+        assert len(FakeOperation.instances) == 2
+        assert all(op.closed for op in FakeOperation.instances)
+
+    def test_empty_list_starts_no_sessions(self):
+        """TC-POOL-03: Пустой список — пустой результат, браузер не запускается"""
+        pool = InvoiceCheckerPool("siberia", MagicMock(), MagicMock(), num_drivers=4)
+        assert pool.check_invoices([]) == []
+        assert FakeOperation.instances == []
+
+
+class TestDmsSessionsSetting:
+    """Unit-тесты настройки dms_sessions: значение по умолчанию, границы, предупреждение."""
+
+    @staticmethod
+    def make_process(settings):
+        return InvoiceCheckerProcess(MagicMock(), settings)
+
+    def test_default_is_single_session_without_warning(self):
+        """TC-POOL-04: Без ключа в настройках — одна сессия, без предупреждений"""
+        process = self.make_process({})
+        assert process._dms_sessions() == 1
+        process.logger.warning.assert_not_called()
+
+    @pytest.mark.parametrize("value, expected", [
+        (0, 1), (-3, 1), ("abc", 1), (None, 1), (2, 2), (100, MAX_DMS_SESSIONS),
+    ])
+    def test_value_is_clamped(self, value, expected):
+        """TC-POOL-05: Значение ограничивается диапазоном 1..MAX_DMS_SESSIONS"""
+        assert self.make_process({"dms_sessions": value})._dms_sessions() == expected
+
+    def test_warns_about_parallel_logins(self):
+        """TC-POOL-06: Больше одной сессии — предупреждение о параллельных входах"""
+        process = self.make_process({"dms_sessions": 2})
+        process._dms_sessions()
+        process.logger.warning.assert_called_once()
@@ -0,0 +1,84 @@
+import pandas as pd
+
+from src.models.invoice.invoice import Invoice
+from src.models.invoice.invoice_rules import (
+    should_process,
+    is_from_region,
+    should_highlight_as_other_region,
+    is_valid_for_dms_check,
+    should_process_mask,
+    is_from_region_mask,
+    should_highlight_as_other_region_mask,
+)
+from src.models.invoice.invoice_validation import FilterInvoices
+
+
+def make_invoice(isa_amount=100.0, sfa_amount=None, region="siberia"):
+    return Invoice(
+        number="05/050426",
+        crm_id="id1",
+        address="г Новосибирск, ул Громова, д 12",
+        isa_amount=isa_amount,
+        sfa_amount=sfa_amount,
+        delivery_city="Новосибирск",
+        prefix="05/",
+        region=region,
+    )
+
+
+class TestInvoiceRules:
+    """Unit-тесты бизнес-правил накладных и их векторных версий."""
+
+    def test_should_process_requires_nonzero_isa_and_empty_sfa(self):
+        """TC-IR-01: Проверяем только ISA ≠ 0 и пустую SFA"""
+        assert should_process(make_invoice(isa_amount=100.0, sfa_amount=None))
+        assert not should_process(make_invoice(isa_amount=0.0, sfa_amount=None))
+        assert not should_process(make_invoice(isa_amount=100.0, sfa_amount=100.0))
+        assert is_valid_for_dms_check(make_invoice())
+
+    def test_should_process_mask_matches_filter_invoices(self):
+        """TC-IR-02: Маска выбирает те же строки, что и FilterInvoices.filter_invoices"""
+        records = [
+            {"isa_amount": "100.00", "sfa_amount": None},
+            {"isa_amount": "0", "sfa_amount": None},
+            {"isa_amount": "0.0", "sfa_amount": None},
+            {"isa_amount": None, "sfa_amount": None},
+            {"isa_amount": "100.00", "sfa_amount": "100.00"},
+            {"isa_amount": "-5", "sfa_amount": None},
+            {"isa_amount": "н/д", "sfa_amount": None},
+        ]
+        kept = FilterInvoices.filter_invoices(records)
+        expected = [i for i, record in enumerate(records) if any(record is k for k in kept)]
+
+        df = pd.DataFrame(records)
+        selected = df.index[should_process_mask(df)].tolist()
+
+        assert selected == expected == [0, 5, 6]
+
+    def test_should_process_mask_numeric_columns(self):
+        """TC-IR-03: Маска работает и с числовыми суммами (NaN = пусто)"""
+        df = pd.DataFrame({
+            "isa_amount": [100.0, 0.0, 50.0],
+            "sfa_amount": [None, None, 50.0],
+        })
+        assert should_process_mask(df).tolist() == [True, False, False]
+
+    def test_region_rules(self):
+        """TC-IR-04: Принадлежность к региону и подсветка 'не свой регион'"""
+        ural = make_invoice(region="ural")
+        assert is_from_region(ural, "ural")
+        assert not is_from_region(ural, "siberia")
+        assert should_highlight_as_other_region(ural, "siberia")
+        assert not should_highlight_as_other_region(ural, "ural")
+        assert not should_highlight_as_other_region(make_invoice(region="unknown"), "siberia")
+
+    def test_region_masks_match_scalar_rules(self):
+        """TC-IR-05: Векторные версии совпадают с правилами для одного Invoice"""
+        regions = ["siberia", "ural", "unknown"]
+        df = pd.DataFrame({"region": regions})
+        invoices = [make_invoice(region=r) for r in regions]
+
+        assert is_from_region_mask(df, "ural").tolist() == [is_from_region(i, "ural") for i in invoices]
+        assert should_highlight_as_other_region_mask(df, "siberia").tolist() == [
+            should_highlight_as_other_region(i, "siberia") for i in invoices
+        ]
@@ -0,0 +1,29 @@
+from unittest.mock import patch
+
+from src.core.paths import ensure_dir
+
+
+class TestEnsureDir:
+    """Unit-тесты ensure_dir: создание, запоминание и пересоздание директорий."""
+
+    def test_creates_nested_directory(self, tmp_path):
+        """TC-PATHS-01: Создаёт директорию вместе с родителями"""
+        target = tmp_path / "a" / "b"
+        assert ensure_dir(target) == target
+        assert target.is_dir()
+
+    def test_repeated_call_skips_mkdir(self, tmp_path):
+        """TC-PATHS-02: Для уже созданной директории mkdir не вызывается"""
+        target = tmp_path / "logs"
+        ensure_dir(target)
+        with patch("pathlib.Path.mkdir") as mkdir:
+            ensure_dir(str(target))
+        mkdir.assert_not_called()
+
+    def test_recreates_deleted_directory(self, tmp_path):
+        """TC-PATHS-03: Удалённая во время работы директория создаётся заново"""
+        target = tmp_path / "temp"
+        ensure_dir(target)
+        target.rmdir()
+        ensure_dir(target)
+        assert target.is_dir()